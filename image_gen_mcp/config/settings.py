@@ -18,6 +18,13 @@ class OpenAISettings(BaseModel):
     timeout: float = Field(30.0, gt=0, description="Request timeout in seconds")
     max_retries: int = Field(3, ge=0, description="Maximum number of retries")
     enabled: bool = Field(True, description="Enable OpenAI provider")
+    http_transport: Literal["httpx", "aiohttp"] = Field(
+        "httpx",
+        description=(
+            "HTTP transport for the image editing API client; aiohttp requires "
+            "the aiohttp extra"
+        ),
+    )
 
     def __str__(self):
         # Mask API key in string representation for test compatibility
@@ -258,6 +265,9 @@ class ServerSettings(BaseModel):
         "INFO", description="Log level"
     )
     rate_limit_rpm: int = Field(50, description="Rate limit requests per minute")
+    max_concurrent_requests: int = Field(
+        5, gt=0, description="Maximum concurrent requests to image providers"
+    )
 
 
 class Settings(BaseSettings):
@@ -1,7 +1,9 @@
 """Unified template loader and manager for JSON-based templates."""
 
+import itertools
 import json
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -58,6 +60,15 @@ class Template:
     conditional_parts: dict[str, dict[str, Any]] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Template resolved once into a bound renderer and its metadata."""
+
+    id: str
+    render: Callable[[dict[str, Any]], str]
+    metadata: dict[str, Any]
+
+
 @dataclass
 class Category:
     """Template category definition."""
@@ -203,6 +214,83 @@ class TemplateRenderer:
     def __init__(self, template_loader: TemplateLoader):
         """Initialize renderer with template loader."""
         self.loader = template_loader
+        self._compiled: dict[str, CompiledTemplate] = {}
+
+    def compile(self, template_id: str) -> CompiledTemplate:
+        """Compile a template into a reusable renderer.
+
+        Required parameters, defaults and the format string for every
+        combination of conditional parts are resolved once, so each render is
+        a dict merge and a ``format_map``.
+
+        Raises:
+            ValueError: If template not found
+        """
+        compiled = self._compiled.get(template_id)
+        if compiled is not None:
+            return compiled
+
+        template = self.loader.get_template(template_id)
+        if not template:
+            raise ValueError(f"Template not found: {template_id}")
+
+        parameter_names = tuple(template.parameters)
+        required = tuple(
+            name for name, param in template.parameters.items() if param.required
+        )
+        defaults = {
+            name: param.default
+            for name, param in template.parameters.items()
+            if param.default is not None
+        }
+        # Conditional parts are inlined into the template up front: one format
+        # string per combination of conditions, picked by the tuple of
+        # predicate results, so a render is a single ``format_map``.
+        conditional_parts = tuple(template.conditional_parts.items())
+        predicates = tuple(
+            self._compile_condition(part_config.get("condition", ""))
+            for _, part_config in conditional_parts
+        )
+        variants = {}
+        for selection in itertools.product((False, True), repeat=len(predicates)):
+            variant = template.template
+            for (part_name, part_config), selected in zip(conditional_parts, selection):
+                value = part_config.get("value", "") if selected else ""
+                variant = variant.replace(f"{{{part_name}}}", value)
+            variants[selection] = variant.format_map
+
+        def render(kwargs: dict[str, Any]) -> str:
+            for param_name in required:
+                if param_name not in kwargs:
+                    raise ValueError(
+                        f"Required parameter '{param_name}' missing for template "
+                        f"'{template_id}'"
+                    )
+
+            render_kwargs = defaults.copy()
+            for param_name in parameter_names:
+                if param_name in kwargs:
+                    render_kwargs[param_name] = kwargs[param_name]
+
+            format_map = variants[
+                tuple(predicate(render_kwargs) for predicate in predicates)
+            ]
+            try:
+                return format_map(render_kwargs)
+            except KeyError as e:
+                raise ValueError(f"Template rendering failed: missing key {e}")
+
+        compiled = CompiledTemplate(
+            id=template_id,
+            render=render,
+            metadata={
+                "recommended_size": template.metadata.recommended_size,
+                "quality": template.metadata.quality,
+                "style": template.metadata.style,
+            },
+        )
+        self._compiled[template_id] = compiled
+        return compiled
 
     def render(self, template_id: str, **kwargs) -> tuple[str, TemplateMetadata]:
         """Render a template with provided parameters.
@@ -217,59 +305,18 @@ class TemplateRenderer:
         Raises:
             ValueError: If template not found or required parameters missing
         """
-        template = self.loader.get_template(template_id)
-        if not template:
-            raise ValueError(f"Template not found: {template_id}")
+        rendered = self.compile(template_id).render(kwargs)
+        return rendered, self.loader.get_template(template_id).metadata
 
-        # Validate required parameters
-        for param_name, param in template.parameters.items():
-            if param.required and param_name not in kwargs:
-                raise ValueError(
-                    f"Required parameter '{param_name}' missing for template "
-                    f"'{template_id}'"
-                )
-
-        # Apply defaults
-        render_kwargs = {}
-        for param_name, param in template.parameters.items():
-            if param_name in kwargs:
-                render_kwargs[param_name] = kwargs[param_name]
-            elif param.default is not None:
-                render_kwargs[param_name] = param.default
-
-        # Handle conditional parts
-        self._apply_conditional_parts(template, render_kwargs)
-
-        # Render template
-        try:
-            rendered = template.template.format(**render_kwargs)
-            return rendered, template.metadata
-        except KeyError as e:
-            raise ValueError(f"Template rendering failed: missing key {e}")
-
-    def _apply_conditional_parts(
-        self, template: Template, kwargs: dict[str, Any]
-    ) -> None:
-        """Apply conditional template parts based on parameter values."""
-        for part_name, part_config in template.conditional_parts.items():
-            condition = part_config.get("condition", "")
-            value = part_config.get("value", "")
-
-            # Simple condition evaluation (can be enhanced)
-            if self._evaluate_condition(condition, kwargs):
-                # Apply the conditional value with parameter substitution
-                kwargs[part_name] = value.format(**kwargs) if "{" in value else value
-            else:
-                kwargs[part_name] = ""
-
-    def _evaluate_condition(self, condition: str, context: dict[str, Any]) -> bool:
-        """Evaluate a simple condition.
+    @staticmethod
+    def _compile_condition(condition: str) -> Callable[[dict[str, Any]], bool]:
+        """Parse a simple condition into a predicate over the render context.
 
         Note: This is a simple implementation. In production, consider
         using a proper expression evaluator for security.
         """
         if not condition:
-            return False
+            return lambda context: False
 
         # Handle simple equality checks
         if "===" in condition:
@@ -289,15 +336,14 @@ class TemplateRenderer:
                     # Remove quotes if present
                     expected_value = expected_value.strip("'\"")
 
-                actual_value = context.get(var_name)
-                return actual_value == expected_value
+                return lambda context: context.get(var_name) == expected_value
 
         # Handle not-null checks
         if "!=" in condition and "null" in condition:
             var_name = condition.split("!=")[0].strip()
-            return context.get(var_name) is not None
+            return lambda context: context.get(var_name) is not None
 
-        return False
+        return lambda context: False
 
 
 class UnifiedTemplateManager:
@@ -403,14 +449,14 @@ class UnifiedTemplateManager:
             ],
         }
 
+    def compile_template(self, template_id: str) -> CompiledTemplate:
+        """Compile a template for repeated rendering."""
+        return self.renderer.compile(template_id)
+
     def render_template(self, template_id: str, **kwargs) -> tuple[str, dict[str, Any]]:
         """Render a template with parameters."""
-        rendered_text, metadata = self.renderer.render(template_id, **kwargs)
-        return rendered_text, {
-            "recommended_size": metadata.recommended_size,
-            "quality": metadata.quality,
-            "style": metadata.style,
-        }
+        compiled = self.renderer.compile(template_id)
+        return compiled.render(kwargs), dict(compiled.metadata)
 
     def validate_parameters(
         self, template_id: str, parameters: dict[str, Any]
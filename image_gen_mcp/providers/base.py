@@ -205,6 +205,14 @@ class LLMProvider(ABC):
             },
         }
 
+    async def warmup(self) -> None:
+        """Open connections ahead of the first request. Override in subclasses."""
+        pass
+
+    async def close(self) -> None:
+        """Release network resources held by the provider."""
+        pass
+
     def __str__(self) -> str:
         return f"{self.name.title()}Provider(enabled={self.config.enabled})"
 
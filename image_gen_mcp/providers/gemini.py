@@ -1,6 +1,6 @@
 """Gemini provider implementation using Google's native Generative AI API."""
 
-import base64
+import asyncio
 import json
 import logging
 import os
@@ -10,6 +10,7 @@ import aiohttp
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 
+from ..utils.base64_utils import b64decode
 from .base import (
     ImageResponse,
     LLMProvider,
@@ -80,6 +81,7 @@ class GeminiProvider(LLMProvider):
         )
         self.timeout = config.timeout
         self.max_retries = config.max_retries
+        self._session: aiohttp.ClientSession | None = None
 
         # Load service account credentials with path validation
         # Resolve and validate the credentials file path to prevent
@@ -171,6 +173,31 @@ class GeminiProvider(LLMProvider):
                 f"Permission denied reading service account file "
                 f"'{resolved_path}': {e}. Please check file permissions."
             ) from e
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=32),
+            )
+        return self._session
+
+    async def warmup(self) -> None:
+        """Open a pooled connection to the API host before the first request."""
+        try:
+            async with self._get_session().head(
+                self.base_url, timeout=aiohttp.ClientTimeout(total=5)
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._logger.debug("Gemini warmup request failed: %s", e)
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     def get_supported_models(self) -> set[str]:
         """Return set of supported Gemini model IDs."""
         return set(self.SUPPORTED_MODELS.keys())
@@ -245,97 +272,98 @@ class GeminiProvider(LLMProvider):
             self._logger.debug(f"Request URL: {url}")
             self._logger.debug(f"Request body: {request_body}")
 
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    url, json=request_body, headers=headers
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise ProviderError(
-                            f"Gemini API error {response.status}: {error_text}",
-                            provider_name=self.name,
-                            error_code="API_ERROR",
-                        )
-
-                    response_data = await response.json()
-
-                    # Extract image data from Imagen predict response
-                    if "predictions" not in response_data:
-                        raise ProviderError(
-                            "Missing 'predictions' field in Imagen response",
-                            provider_name=self.name,
-                            error_code="INVALID_RESPONSE",
-                        )
-
-                    predictions = response_data["predictions"]
-                    if not isinstance(predictions, list):
-                        raise ProviderError(
-                            f"'predictions' field is not a list but "
-                            f"{type(predictions).__name__}",
-                            provider_name=self.name,
-                            error_code="INVALID_RESPONSE",
-                        )
-
-                    if len(predictions) == 0:
-                        raise ProviderError(
-                            "Empty predictions list in Imagen response",
-                            provider_name=self.name,
-                            error_code="INVALID_RESPONSE",
-                        )
-
-                    prediction = predictions[0]
-
-                    # Extract image data from Vertex AI Imagen response
-                    # Expected format: {"bytesBase64Encoded": "base64_string"}
-                    # Documentation: https://cloud.google.com/vertex-ai/docs/generative-ai/model-reference/imagen
-                    # Fail fast if API format changes to detect issues immediately
-                    if not isinstance(prediction, dict):
-                        prediction_type = type(prediction).__name__
-                        raise ProviderError(
-                            f"Unexpected prediction format. Expected dict but got "
-                            f"{prediction_type}. This indicates a Vertex AI API "
-                            "change that requires code updates.",
-                            provider_name=self.name,
-                            error_code="INVALID_RESPONSE",
-                        )
-                    if "bytesBase64Encoded" not in prediction:
-                        available_keys = list(prediction.keys())
-                        raise ProviderError(
-                            f"Missing expected 'bytesBase64Encoded' field in Imagen "
-                            f"response. Available fields: {available_keys}. This "
-                            "indicates a Vertex AI API change - please update the "
-                            "integration.",
-                            provider_name=self.name,
-                            error_code="INVALID_RESPONSE",
-                        )
-                    image_data = prediction["bytesBase64Encoded"]
-                    if not image_data:
-                        raise ProviderError(
-                            "Empty image data in 'bytesBase64Encoded' field",
-                            provider_name=self.name,
-                            error_code="INVALID_RESPONSE",
-                        )
-
-                    # Decode base64 image data
-                    image_bytes = base64.b64decode(image_data)
-
-                    # Build metadata
-                    metadata = {
-                        "model": model,
-                        "prompt": prompt,
-                        "size": size,
-                        "quality": quality,
-                        "provider": self.name,
-                        "created_at": None,  # Gemini doesn't provide timestamp
-                    }
-
-                    return ImageResponse(
-                        image_data=image_bytes,
-                        metadata=metadata,
-                        provider_response=response_data,
+            session = self._get_session()
+            async with session.post(
+                url, json=request_body, headers=headers
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise ProviderError(
+                        f"Gemini API error {response.status}: {error_text}",
+                        provider_name=self.name,
+                        error_code="API_ERROR",
+                    )
+
+                response_data = await response.json()
+
+                # Extract image data from Imagen predict response
+                if "predictions" not in response_data:
+                    raise ProviderError(
+                        "Missing 'predictions' field in Imagen response",
+                        provider_name=self.name,
+                        error_code="INVALID_RESPONSE",
                     )
 
+                predictions = response_data["predictions"]
+                if not isinstance(predictions, list):
+                    raise ProviderError(
+                        f"'predictions' field is not a list but "
+                        f"{type(predictions).__name__}",
+                        provider_name=self.name,
+                        error_code="INVALID_RESPONSE",
+                    )
+
+                if len(predictions) == 0:
+                    raise ProviderError(
+                        "Empty predictions list in Imagen response",
+                        provider_name=self.name,
+                        error_code="INVALID_RESPONSE",
+                    )
+
+                prediction = predictions[0]
+
+                # Extract image data from Vertex AI Imagen response
+                # Expected format: {"bytesBase64Encoded": "base64_string"}
+                # Documentation: https://cloud.google.com/vertex-ai/docs/generative-ai/model-reference/imagen
+                # Fail fast if API format changes to detect issues immediately
+                if not isinstance(prediction, dict):
+                    prediction_type = type(prediction).__name__
+                    raise ProviderError(
+                        f"Unexpected prediction format. Expected dict but got "
+                        f"{prediction_type}. This indicates a Vertex AI API "
+                        "change that requires code updates.",
+                        provider_name=self.name,
+                        error_code="INVALID_RESPONSE",
+                    )
+                if "bytesBase64Encoded" not in prediction:
+                    available_keys = list(prediction.keys())
+                    raise ProviderError(
+                        f"Missing expected 'bytesBase64Encoded' field in Imagen "
+                        f"response. Available fields: {available_keys}. This "
+                        "indicates a Vertex AI API change - please update the "
+                        "integration.",
+                        provider_name=self.name,
+                        error_code="INVALID_RESPONSE",
+                    )
+                # Popped so the retained response does not keep the payload alive
+                image_data = prediction.pop("bytesBase64Encoded")
+                if not image_data:
+                    raise ProviderError(
+                        "Empty image data in 'bytesBase64Encoded' field",
+                        provider_name=self.name,
+                        error_code="INVALID_RESPONSE",
+                    )
+
+                # Decode base64 image data in a worker thread so multi-MB
+                # payloads do not stall the event loop
+                image_bytes = await asyncio.to_thread(b64decode, image_data)
+
+                # Build metadata
+                metadata = {
+                    "model": model,
+                    "prompt": prompt,
+                    "size": size,
+                    "quality": quality,
+                    "provider": self.name,
+                    "created_at": None,  # Gemini doesn't provide timestamp
+                }
+
+                return ImageResponse(
+                    image_data=image_bytes,
+                    metadata=metadata,
+                    provider_response=response_data,
+                )
+
         except aiohttp.ClientError as e:
             self._logger.error(f"Network error with Gemini: {e}")
             raise ProviderError(
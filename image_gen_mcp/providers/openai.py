@@ -1,12 +1,14 @@
 """OpenAI provider implementation."""
 
-import base64
+import asyncio
+import importlib.util
 import logging
 from typing import Any
 
 import httpx
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
+from ..utils.base64_utils import b64decode
 from .base import (
     ImageResponse,
     LLMProvider,
@@ -17,6 +19,14 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 is used for the connection pool when the optional ``h2`` package
+# (``httpx[http2]``) is installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# The raw response is kept for reference without its base64 payload, which has
+# already been decoded into image_data and would otherwise stay alive with it
+RESPONSE_DUMP_EXCLUDE = {"data": {"__all__": {"b64_json"}}}
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI provider for image generation using gpt-image-1 and DALL-E models."""
@@ -41,13 +51,35 @@ class OpenAIProvider(LLMProvider):
 
     def __init__(self, config: ProviderConfig):
         super().__init__(config)
-        self.client = AsyncOpenAI(
-            api_key=config.api_key,
-            organization=config.organization,
-            base_url=config.base_url or "https://api.openai.com/v1",
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
+        self._client: AsyncOpenAI | None = None
+        self._http_client: httpx.AsyncClient | None = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Connection pool shared by API calls and image downloads.
+
+        Created on first use, so a provider that is never registered holds no
+        connections. The SDK's default pool limits are kept.
+        """
+        if self._http_client is None:
+            self._http_client = DefaultAsyncHttpxClient(
+                http2=HTTP2_AVAILABLE, timeout=self.config.timeout
+            )
+        return self._http_client
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI API client, created on first use."""
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                api_key=self.config.api_key,
+                organization=self.config.organization,
+                base_url=self.config.base_url or "https://api.openai.com/v1",
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries,
+                http_client=self.http_client,
+            )
+        return self._client
 
     def get_supported_models(self) -> set[str]:
         """Return set of supported OpenAI model IDs."""
@@ -131,8 +163,11 @@ class OpenAIProvider(LLMProvider):
 
             # Process response - OpenAI returns base64 for gpt-image-1, URLs for DALL-E
             if hasattr(response.data[0], "b64_json") and response.data[0].b64_json:
-                # Base64 response (gpt-image-1)
-                image_bytes = base64.b64decode(response.data[0].b64_json)
+                # Base64 response (gpt-image-1), decoded in a worker thread so
+                # multi-MB payloads do not stall the event loop
+                image_bytes = await asyncio.to_thread(
+                    b64decode, response.data[0].b64_json
+                )
             elif hasattr(response.data[0], "url") and response.data[0].url:
                 # URL response (DALL-E models)
                 image_bytes = await self._download_image(response.data[0].url)
@@ -167,7 +202,9 @@ class OpenAIProvider(LLMProvider):
                 image_data=image_bytes,
                 metadata=metadata,
                 provider_response=(
-                    response.model_dump() if hasattr(response, "model_dump") else None
+                    response.model_dump(exclude=RESPONSE_DUMP_EXCLUDE)
+                    if hasattr(response, "model_dump")
+                    else None
                 ),
             )
 
@@ -205,11 +242,12 @@ class OpenAIProvider(LLMProvider):
 
         capabilities = self.SUPPORTED_MODELS[model]
 
-        # Convert base64 strings to bytes if needed
+        # Convert base64 strings to bytes if needed, decoding multi-MB payloads
+        # in a worker thread so they do not stall the event loop
         if isinstance(image_data, str):
             if image_data.startswith("data:"):
-                image_data = image_data.split(",", 1)[1]
-            image_bytes = base64.b64decode(image_data)
+                image_data = image_data.partition(",")[2]
+            image_bytes = await asyncio.to_thread(b64decode, image_data)
         else:
             image_bytes = image_data
 
@@ -217,8 +255,8 @@ class OpenAIProvider(LLMProvider):
         if mask_data:
             if isinstance(mask_data, str):
                 if mask_data.startswith("data:"):
-                    mask_data = mask_data.split(",", 1)[1]
-                mask_bytes = base64.b64decode(mask_data)
+                    mask_data = mask_data.partition(",")[2]
+                mask_bytes = await asyncio.to_thread(b64decode, mask_data)
             else:
                 mask_bytes = mask_data
 
@@ -261,7 +299,9 @@ class OpenAIProvider(LLMProvider):
 
             # Process response (similar to generate_image)
             if hasattr(response.data[0], "b64_json") and response.data[0].b64_json:
-                image_bytes = base64.b64decode(response.data[0].b64_json)
+                image_bytes = await asyncio.to_thread(
+                    b64decode, response.data[0].b64_json
+                )
             elif hasattr(response.data[0], "url") and response.data[0].url:
                 image_bytes = await self._download_image(response.data[0].url)
             else:
@@ -285,7 +325,9 @@ class OpenAIProvider(LLMProvider):
                 image_data=image_bytes,
                 metadata=metadata,
                 provider_response=(
-                    response.model_dump() if hasattr(response, "model_dump") else None
+                    response.model_dump(exclude=RESPONSE_DUMP_EXCLUDE)
+                    if hasattr(response, "model_dump")
+                    else None
                 ),
             )
 
@@ -300,10 +342,9 @@ class OpenAIProvider(LLMProvider):
     async def _download_image(self, image_url: str) -> bytes:
         """Download image from URL (for DALL-E models that return URLs)."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(image_url)
-                response.raise_for_status()
-                return response.content
+            response = await self.http_client.get(image_url)
+            response.raise_for_status()
+            return response.content
         except Exception as e:
             raise ProviderError(
                 f"Failed to download image from URL: {str(e)}",
@@ -311,6 +352,22 @@ class OpenAIProvider(LLMProvider):
                 error_code="DOWNLOAD_FAILED",
             )
 
+    async def warmup(self) -> None:
+        """Open a pooled connection to the API host before the first request."""
+        try:
+            await self.http_client.head(str(self.client.base_url), timeout=5.0)
+        except httpx.HTTPError as e:
+            self._logger.debug("OpenAI warmup request failed: %s", e)
+
+    async def close(self) -> None:
+        """Close the API client and connection pool, if they were created."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     def estimate_cost(
         self, model: str, prompt: str, image_count: int = 1
     ) -> dict[str, Any]:
@@ -262,6 +262,13 @@ class ProviderRegistry:
             },
         }
 
+    async def close(self) -> None:
+        """Close all registered providers."""
+        await asyncio.gather(
+            *(provider.close() for provider in self._providers.values()),
+            return_exceptions=True,
+        )
+
     def __str__(self) -> str:
         return (
             f"ProviderRegistry(providers={len(self._providers)}, "
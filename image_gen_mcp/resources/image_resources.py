@@ -1,11 +1,14 @@
 """Image resource management for MCP server."""
 
+import asyncio
 import base64
-import json
 import logging
+from typing import Any
 
 from ..config.settings import StorageSettings
 from ..storage.manager import ImageStorageManager
+from ..utils.inflight import InflightRequests
+from ..utils.json_utils import dumps_pretty
 
 logger = logging.getLogger(__name__)
 
@@ -20,49 +23,67 @@ class ImageResourceManager:
     ):
         self.storage_manager = storage_manager
         self.settings = settings
+        self._inflight = InflightRequests()
 
     async def get_image_resource(self, image_id: str) -> str:
-        """Get a generated image by its unique ID."""
-        try:
-            image_data, metadata = await self.storage_manager.load_image(image_id)
+        """Get a generated image by its unique ID.
 
-            # Determine the image format
-            file_format = metadata.get("file_info", {}).get("format", "PNG").lower()
-            mime_type = f"image/{file_format}"
+        Concurrent requests for the same image share one read and encode.
+        """
+        return await self._inflight.run(
+            image_id, lambda: self._build_image_resource(image_id)
+        )
 
-            # Encode as base64 for transport
-            base64_data = base64.b64encode(image_data).decode()
+    async def _build_image_resource(self, image_id: str) -> str:
+        """Load, encode and format an image resource."""
+        try:
+            image_data, metadata = await self.storage_manager.load_image(image_id)
 
-            # Return as a formatted resource
-            return json.dumps(
-                {
-                    "image_id": image_id,
-                    "data_url": f"data:{mime_type};base64,{base64_data}",
-                    "metadata": metadata,
-                    "mime_type": mime_type,
-                    "size_bytes": len(image_data),
-                },
-                indent=2,
+            # Encoding and serializing a multi-megabyte image is CPU-bound, so
+            # it runs in a worker thread to keep the event loop responsive
+            return await asyncio.to_thread(
+                self._format_image_resource, image_id, image_data, metadata
             )
 
         except FileNotFoundError:
-            return json.dumps(
+            return dumps_pretty(
                 {
                     "error": f"Image {image_id} not found",
                     "image_id": image_id,
-                },
-                indent=2,
+                }
             )
         except Exception as e:
             logger.error(f"Error retrieving image {image_id}: {e}")
-            return json.dumps(
+            return dumps_pretty(
                 {
                     "error": f"Failed to retrieve image: {str(e)}",
                     "image_id": image_id,
-                },
-                indent=2,
+                }
             )
 
+    @staticmethod
+    def _format_image_resource(
+        image_id: str, image_data: bytes, metadata: dict[str, Any]
+    ) -> str:
+        """Encode image bytes as a data URL and format the resource JSON."""
+        # Determine the image format
+        file_format = metadata.get("file_info", {}).get("format", "PNG").lower()
+        mime_type = f"image/{file_format}"
+
+        # Encode as base64 for transport
+        base64_data = base64.b64encode(image_data).decode()
+
+        # Return as a formatted resource
+        return dumps_pretty(
+            {
+                "image_id": image_id,
+                "data_url": f"data:{mime_type};base64,{base64_data}",
+                "metadata": metadata,
+                "mime_type": mime_type,
+                "size_bytes": len(image_data),
+            }
+        )
+
     async def get_recent_images(self, limit: int = 10, days: int = 7) -> str:
         """Get recent image generation history."""
         try:
@@ -106,17 +127,16 @@ class ImageResourceManager:
                 "storage_usage_mb": stats.get("storage_usage_mb", 0),
             }
 
-            return json.dumps(result, indent=2)
+            return dumps_pretty(result)
 
         except Exception as e:
             logger.error(f"Error retrieving recent images: {e}")
-            return json.dumps(
+            return dumps_pretty(
                 {
                     "error": f"Failed to retrieve recent images: {str(e)}",
                     "images": [],
                     "total_count": 0,
-                },
-                indent=2,
+                }
             )
 
     async def get_storage_stats(self) -> str:
@@ -167,15 +187,14 @@ class ImageResourceManager:
                     "No images found. Start generating images to populate storage."
                 )
 
-            return json.dumps(enhanced_stats, indent=2)
+            return dumps_pretty(enhanced_stats)
 
         except Exception as e:
             logger.error(f"Error retrieving storage stats: {e}")
-            return json.dumps(
+            return dumps_pretty(
                 {
                     "error": f"Failed to retrieve storage stats: {str(e)}",
                     "total_images": 0,
                     "storage_usage_mb": 0,
-                },
-                indent=2,
+                }
             )
@@ -6,8 +6,6 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Optional
 
-import aiofiles
-
 
 @dataclass
 class ModelInfo:
@@ -56,18 +54,19 @@ class ModelRegistry:
         Returns:
             ModelInfo object or None if not found
         """
-        # Check cache first
-        async with self._cache_lock:
-            if model_id in self._model_cache:
-                return self._model_cache[model_id]
+        # Check cache first; plain dict reads need no lock on the event loop
+        cached = self._model_cache.get(model_id)
+        if cached is not None:
+            return cached
 
         # Try to load from file
         model_file = self.models_dir / f"{model_id}.json"
         if model_file.exists():
             try:
-                async with aiofiles.open(model_file, encoding="utf-8") as f:
-                    content = await f.read()
-                    data = json.loads(content)
+                content = await asyncio.to_thread(
+                    model_file.read_text, encoding="utf-8"
+                )
+                data = json.loads(content)
 
                 model_info = ModelInfo(**data)
 
@@ -97,8 +96,8 @@ class ModelRegistry:
 
         # Save to file
         model_file = self.models_dir / f"{model_info.model_id}.json"
-        async with aiofiles.open(model_file, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(asdict(model_info), indent=2, ensure_ascii=False))
+        content = json.dumps(asdict(model_info), indent=2, ensure_ascii=False)
+        await asyncio.to_thread(model_file.write_text, content, encoding="utf-8")
 
     async def list_models(self) -> list[str]:
         """List all available model IDs."""
@@ -115,10 +114,10 @@ class ModelRegistry:
             Formatted markdown documentation (includes 'not found' message if
             model doesn't exist)
         """
-        # Check documentation cache first
-        async with self._cache_lock:
-            if model_id in self._documentation_cache:
-                return self._documentation_cache[model_id]
+        # Check documentation cache first; cache hits return the stored string
+        cached = self._documentation_cache.get(model_id)
+        if cached is not None:
+            return cached
 
         model_info = await self.get_model_info(model_id)
 
@@ -145,8 +144,9 @@ Examples:
         doc_file = self.models_dir / f"{model_id}.md"
         if doc_file.exists():
             try:
-                async with aiofiles.open(doc_file, encoding="utf-8") as f:
-                    doc_content = await f.read()
+                doc_content = await asyncio.to_thread(
+                    doc_file.read_text, encoding="utf-8"
+                )
 
                 # Cache the documentation
                 async with self._cache_lock:
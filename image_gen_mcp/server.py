@@ -5,15 +5,20 @@ This server integrates multiple image-generation providers behind a unified MCP
 
 import argparse
 import asyncio
+import atexit
 import logging
+import queue
 import sys
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Optional
 
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.prompts import Prompt
 from pydantic import Field, ValidationError
 
 from .config.settings import Settings
@@ -25,7 +30,9 @@ from .storage.manager import ImageStorageManager
 from .tools.image_editing import ImageEditingTool
 from .tools.image_generation import ImageGenerationTool
 from .utils.cache import CacheManager
+from .utils.json_utils import dumps_pretty
 from .utils.path_utils import find_existing_image_path
+from .utils.rate_limit import RequestLimiter
 from .utils.validators import (
     sanitize_prompt,
     validate_background_type,
@@ -55,20 +62,83 @@ class ServerContext:
     image_editing_tool: ImageEditingTool
     resource_manager: ImageResourceManager
 
+    # Bound tool entry points, resolved once so handlers skip the attribute chain
+    generate: Callable[..., Awaitable[dict[str, Any]]] = field(init=False, repr=False)
+    edit: Callable[..., Awaitable[dict[str, Any]]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.generate = self.image_generation_tool.generate
+        self.edit = self.image_editing_tool.edit
+
+
+# Server context bound by the lifespan for the duration of a server run
+_SERVER_CTX: ContextVar[ServerContext] = ContextVar("server_ctx")
 
 # Global settings - will be initialized in main()
 settings: Optional[Settings] = None
 
+# Upper bound on how long each service may take to close during shutdown
+SERVICE_CLOSE_TIMEOUT = 5.0
+
+# Upper bound on how long background tasks may take to unwind after cancel
+CLEANUP_CANCEL_TIMEOUT = 2.0
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+
+    The stock ``QueueHandler.prepare`` formats the message and traceback in
+    the emitting thread so records can be pickled; records here never leave
+    the process, so they are enqueued as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued records and stop the logging listener thread."""
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
 
 def configure_logging(log_level: str = "INFO") -> None:
-    """Configure logging with the specified level."""
+    """Configure logging with the specified level.
+
+    Records are handed to a background listener thread through a queue, so
+    message and traceback formatting and the stderr write happen off the
+    event loop.
+    """
+    global _log_listener
+
     level = getattr(logging, log_level.upper())
 
+    _stop_log_listener()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
     # Configure root logger
     logging.basicConfig(
         level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[_DeferredQueueHandler(log_queue)],
         force=True,  # Force reconfiguration
     )
 
@@ -79,6 +149,35 @@ def configure_logging(log_level: str = "INFO") -> None:
             logger_instance.setLevel(level)
 
 
+def install_event_loop_policy() -> None:
+    """Use uvloop for the server event loop when it is installed."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop policy")
+
+
+def run_with_hypercorn(app: Any, host: str, port: int) -> None:
+    """Serve an ASGI app with Hypercorn, which also speaks HTTP/2."""
+    try:
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+    except ImportError:
+        logger.error(
+            "Hypercorn is not installed. Install the 'hypercorn' extra or use "
+            "--server uvicorn"
+        )
+        sys.exit(1)
+
+    config = Config()
+    config.bind = [f"{host}:{port}"]
+    asyncio.run(serve(app, config))
+
+
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -100,6 +199,9 @@ Examples:
 
   # Run with SSE transport
   python -m image_gen_mcp.server --transport sse --port 8080
+
+  # Serve HTTP transport with Hypercorn (HTTP/1.1 and HTTP/2)
+  python -m image_gen_mcp.server --transport streamable-http --server hypercorn
         """,
     )
 
@@ -141,6 +243,14 @@ Examples:
         "--cors", action="store_true", help="Enable CORS for web deployments"
     )
 
+    parser.add_argument(
+        "--server",
+        type=str,
+        choices=["uvicorn", "hypercorn"],
+        default="uvicorn",
+        help="ASGI server for HTTP transports (default: uvicorn)",
+    )
+
     parser.add_argument("--version", action="version", version="%(prog)s 0.1.0")
 
     return parser.parse_args()
@@ -166,13 +276,35 @@ def load_settings(
         settings = settings_instance
         return settings
     except ValidationError as e:
-        logger.error(f"Failed to load settings due to validation error:\n{e}")
+        logger.error("Failed to load settings due to validation error:\n%s", e)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"An unexpected error occurred while loading settings: {e}")
+        logger.error("An unexpected error occurred while loading settings: %s", e)
         sys.exit(1)
 
 
+async def _warm_up_services(*services: Any) -> None:
+    """Warm service connections ahead of first use, logging failures."""
+    results = await asyncio.gather(
+        *(service.warmup() for service in services), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.debug("Service warmup failed: %s", result)
+
+
+async def _close_service(
+    name: str, close: Awaitable[None], timeout: float = SERVICE_CLOSE_TIMEOUT
+) -> None:
+    """Await a service close call, logging failures instead of raising them."""
+    try:
+        await asyncio.wait_for(close, timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Timed out closing %s service after %ss", name, timeout)
+    except Exception as e:
+        logger.warning("Error closing %s service: %s", name, e)
+
+
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[ServerContext]:
     """
@@ -181,28 +313,32 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[ServerContext]:
     This context manager ensures proper initialization and cleanup of all
     server resources, including storage, cache, and background tasks.
     """
-    logger.info(f"Starting {settings.server.name} v{settings.server.version}")
-
-    # Initialize storage directories
-    storage_path = Path(settings.storage.base_path)
-    for subdir in ["images", "cache", "logs"]:
-        (storage_path / subdir).mkdir(parents=True, exist_ok=True)
+    logger.info("Starting %s v%s", settings.server.name, settings.server.version)
 
     # Initialize services with dependency injection
     storage_manager = ImageStorageManager(settings.storage)
     cache_manager = CacheManager(settings.cache)
 
+    # Shared limiter so generation and editing together stay within the
+    # configured concurrency and requests-per-minute budget
+    request_limiter = RequestLimiter(
+        max_concurrent=settings.server.max_concurrent_requests,
+        requests_per_minute=settings.server.rate_limit_rpm,
+    )
+
     # Initialize tools and resources
     image_generation_tool = ImageGenerationTool(
         storage_manager=storage_manager,
         cache_manager=cache_manager,
         settings=settings,
+        request_limiter=request_limiter,
     )
 
     image_editing_tool = ImageEditingTool(
         storage_manager=storage_manager,
         cache_manager=cache_manager,
         settings=settings,
+        request_limiter=request_limiter,
     )
 
     resource_manager = ImageResourceManager(
@@ -210,38 +346,59 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[ServerContext]:
     )
 
     # Initialize async services
-    await asyncio.gather(
-        cache_manager.initialize(),
-        storage_manager.initialize(),
-    )
+    await asyncio.gather(cache_manager.initialize(), storage_manager.initialize())
 
-    # Start background tasks
+    # Start background tasks. Provider warmup is best effort and off the
+    # startup path, so a slow or unreachable API host cannot delay a session
     cleanup_task = asyncio.create_task(
         storage_manager.start_cleanup_task(), name="storage-cleanup"
     )
+    warmup_task = asyncio.create_task(
+        _warm_up_services(image_generation_tool, image_editing_tool),
+        name="provider-warmup",
+    )
+
+    server_context = ServerContext(
+        settings=settings,
+        storage_manager=storage_manager,
+        cache_manager=cache_manager,
+        image_generation_tool=image_generation_tool,
+        image_editing_tool=image_editing_tool,
+        resource_manager=resource_manager,
+    )
+    # Request handlers run in tasks spawned under this context, so they read
+    # the services straight from the variable instead of via mcp.get_context()
+    server_context_token = _SERVER_CTX.set(server_context)
 
     try:
-        yield ServerContext(
-            settings=settings,
-            storage_manager=storage_manager,
-            cache_manager=cache_manager,
-            image_generation_tool=image_generation_tool,
-            image_editing_tool=image_editing_tool,
-            resource_manager=resource_manager,
-        )
+        yield server_context
     finally:
+        _SERVER_CTX.reset(server_context_token)
         logger.info("Shutting down server...")
 
-        # Cancel background tasks gracefully
+        # Cancel background tasks, waiting a bounded time for them to unwind
+        # so a cleanup pass stuck in I/O cannot hold up the rest of shutdown
+        warmup_task.cancel()
         cleanup_task.cancel()
-        try:
-            await cleanup_task
-        except asyncio.CancelledError:
-            pass
+        done, _ = await asyncio.wait(
+            {cleanup_task, warmup_task}, timeout=CLEANUP_CANCEL_TIMEOUT
+        )
+        if cleanup_task not in done:
+            logger.warning(
+                "Storage cleanup task did not stop within %.1fs",
+                CLEANUP_CANCEL_TIMEOUT,
+            )
+        elif not cleanup_task.cancelled() and cleanup_task.exception():
+            logger.warning("Storage cleanup task failed: %s", cleanup_task.exception())
 
-        # Close services
+        # Close services concurrently; each close is bounded and isolated so a
+        # stuck or failing service does not block the others, while
+        # cancellation of the shutdown itself still propagates
         await asyncio.gather(
-            cache_manager.close(), storage_manager.close(), return_exceptions=True
+            _close_service("cache", cache_manager.close()),
+            _close_service("storage", storage_manager.close()),
+            _close_service("image generation", image_generation_tool.close()),
+            _close_service("image editing", image_editing_tool.close()),
         )
 
         logger.info("Server shutdown complete")
@@ -259,7 +416,9 @@ mcp = FastMCP(
         "python-dotenv",
         "pydantic",
         "httpx",
-        "aiofiles",
+        "orjson",
+        "pybase64",
+        "uvloop; sys_platform != 'win32'",
     ],
 )
 
@@ -307,7 +466,7 @@ async def serve_image(request):
         )
 
     except Exception as e:
-        logger.error(f"Error serving image {image_id}: {e}")
+        logger.error("Error serving image %s: %s", image_id, e)
         return Response("Internal server error", status_code=500)
 
 
@@ -316,9 +475,18 @@ logger = logging.getLogger(__name__)
 
 
 # Helper function to get server context
-def get_server_context(ctx) -> ServerContext:
-    """Get server context from MCP context."""
-    return ctx.request_context.lifespan_context
+def get_server_context(ctx=None) -> ServerContext:
+    """Get server context, preferring the one bound by the lifespan.
+
+    Falls back to the MCP request context (``ctx`` or ``mcp.get_context()``)
+    when called outside the lifespan, e.g. with a mocked context in tests.
+    """
+    server_ctx = _SERVER_CTX.get(None)
+    if server_ctx is None:
+        if ctx is None:
+            ctx = mcp.get_context()
+        server_ctx = ctx.request_context.lifespan_context
+    return server_ctx
 
 
 # Tool definitions
@@ -333,7 +501,7 @@ async def health_check() -> dict[str, Any]:
     - version: server version
     - services: status of dependent services
     """
-    server_ctx = mcp.get_context().request_context.lifespan_context
+    server_ctx = get_server_context()
 
     try:
         # Check OpenAI client
@@ -381,7 +549,7 @@ async def health_check() -> dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return {
             "status": "unhealthy",
             "timestamp": asyncio.get_event_loop().time(),
@@ -401,7 +569,7 @@ async def server_info() -> dict[str, Any]:
     - capabilities: available features
     - configuration: non-sensitive configuration details
     """
-    server_ctx = mcp.get_context().request_context.lifespan_context
+    server_ctx = get_server_context()
 
     try:
         return {
@@ -436,7 +604,7 @@ async def server_info() -> dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Server info failed: {e}")
+        logger.error("Server info failed: %s", e)
         return {"error": str(e)}
 
 
@@ -510,8 +678,7 @@ async def generate_image(
     - resource_uri: MCP resource URI for future access
     - metadata: Generation details and parameters including model and provider info
     """
-    ctx = mcp.get_context()
-    server_ctx = get_server_context(ctx)
+    server_ctx = get_server_context()
 
     # Validate and sanitize inputs with fault tolerance
     validated_prompt = sanitize_prompt(prompt)
@@ -524,7 +691,7 @@ async def generate_image(
     validated_background = validate_background_type(background)
 
     try:
-        result = await server_ctx.image_generation_tool.generate(
+        result = await server_ctx.generate(
             prompt=validated_prompt,
             model=model,  # Pass the model parameter
             quality=validated_quality,
@@ -537,7 +704,7 @@ async def generate_image(
         )
         return result
     except Exception as e:
-        logger.error(f"Image generation failed: {e}", exc_info=True)
+        logger.error("Image generation failed: %s", e, exc_info=True)
         raise
 
 
@@ -591,8 +758,7 @@ async def edit_image(
     - operation: "edit" to indicate this was an edit operation
     - metadata: Edit details and parameters
     """
-    ctx = mcp.get_context()
-    server_ctx = get_server_context(ctx)
+    server_ctx = get_server_context()
 
     # Validate inputs
     validated_image_data = validate_base64_image(image_data)
@@ -605,7 +771,7 @@ async def edit_image(
     validated_background = validate_background_type(background)
 
     try:
-        result = await server_ctx.image_editing_tool.edit(
+        result = await server_ctx.edit(
             image_data=validated_image_data,
             prompt=validated_prompt,
             mask_data=validated_mask_data,
@@ -617,7 +783,7 @@ async def edit_image(
         )
         return result
     except Exception as e:
-        logger.error(f"Image editing failed: {e}", exc_info=True)
+        logger.error("Image editing failed: %s", e, exc_info=True)
         raise
 
 
@@ -638,8 +804,7 @@ async def list_available_models() -> dict[str, Any]:
     - Provider status and configuration
     - Cost estimates and features
     """
-    ctx = mcp.get_context()
-    server_ctx = get_server_context(ctx)
+    server_ctx = get_server_context()
 
     try:
         # Ensure providers are registered
@@ -695,7 +860,7 @@ async def list_available_models() -> dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Failed to list available models: {e}", exc_info=True)
+        logger.error("Failed to list available models: %s", e, exc_info=True)
         return {
             "error": str(e),
             "summary": {
@@ -724,8 +889,7 @@ async def get_generated_image(
     ),
 ) -> str:
     """Access a generated image by its unique ID."""
-    ctx = mcp.get_context()
-    server_ctx = get_server_context(ctx)
+    server_ctx = get_server_context()
     return await server_ctx.resource_manager.get_image_resource(image_id)
 
 
@@ -755,8 +919,7 @@ async def get_recent_images(
     ),
 ) -> str:
     """Get recent image generation history."""
-    ctx = mcp.get_context()
-    server_ctx = get_server_context(ctx)
+    server_ctx = get_server_context()
 
     # Validate parameters
     validated_limit = validate_limit(limit, 100)
@@ -779,8 +942,7 @@ async def get_recent_images(
 )
 async def get_storage_stats() -> str:
     """Get storage statistics and management information."""
-    ctx = mcp.get_context()
-    server_ctx = get_server_context(ctx)
+    server_ctx = get_server_context()
     return await server_ctx.resource_manager.get_storage_stats()
 
 
@@ -815,8 +977,6 @@ async def get_model_info(
 )
 async def list_models() -> str:
     """List all available AI models."""
-    import json
-
     models = []
     for model_id in await model_registry.list_models():
         model_info = await model_registry.get_model_info(model_id)
@@ -831,7 +991,7 @@ async def list_models() -> str:
                 }
             )
 
-    return json.dumps(
+    return dumps_pretty(
         {
             "models": models,
             "total": len(models),
@@ -842,8 +1002,7 @@ async def list_models() -> str:
                 ),
                 "example": "model-info://gpt-image-1",
             },
-        },
-        indent=2,
+        }
     )
 
 
@@ -864,9 +1023,7 @@ async def list_prompt_templates() -> str:
     Users can browse available templates and understand their parameters
     before using them with mcp.prompt functions.
     """
-    import json
-
-    return json.dumps(prompt_template_resource_manager.list_templates(), indent=2)
+    return dumps_pretty(prompt_template_resource_manager.list_templates())
 
 
 @mcp.resource(
@@ -889,8 +1046,6 @@ async def get_prompt_template(
     ),
 ) -> str:
     """Get detailed information about a specific prompt template."""
-    import json
-
     template_details = prompt_template_resource_manager.get_template_details(
         template_name
     )
@@ -902,9 +1057,9 @@ async def get_prompt_template(
                 template_name
             )
         )
-        return json.dumps(error_response, indent=2)
+        return dumps_pretty(error_response)
 
-    return json.dumps(template_details, indent=2)
+    return dumps_pretty(template_details)
 
 
 # ===================================================================
@@ -920,411 +1075,497 @@ async def get_prompt_template(
 # ===================================================================
 
 
-async def _generate_from_template(template_id: str, **kwargs) -> dict[str, Any]:
+# Prompt handler schemas keyed by template ID. Each parameter maps to its type
+# annotation (as source text) and a Field default that is built once at import.
+_TEMPLATE_SCHEMAS: dict[str, dict[str, Any]] = {
+    "creative_image": {
+        "title": "Creative Image Generation",
+        "description": (
+            "Generate creative images with expert art direction. Combines subject, "
+            "artistic style, mood, and color palette to create vivid, artistic images."
+        ),
+        "parameters": {
+            "subject": (
+                "str",
+                Field(
+                    ...,
+                    description="Main subject of the image - be specific and detailed",
+                ),
+            ),
+            "style": (
+                "str",
+                Field(default="digital art", description="Artistic style or medium"),
+            ),
+            "setting": (
+                "str",
+                Field(
+                    default="dramatic environment",
+                    description="Environmental setting or location",
+                ),
+            ),
+            "mood": (
+                "str",
+                Field(default="vibrant", description="Desired mood or emotional tone"),
+            ),
+            "lighting": (
+                "str",
+                Field(default="dramatic", description="Lighting style"),
+            ),
+            "color_palette": (
+                "str",
+                Field(
+                    default="rich and vibrant", description="Color scheme preference"
+                ),
+            ),
+            "composition": (
+                "str",
+                Field(default="dynamic", description="Compositional approach"),
+            ),
+        },
+    },
+    "product_photography": {
+        "title": "Product Photography",
+        "description": (
+            "Generate professional product photography with commercial specifications. "
+            "Optimized for e-commerce, catalogs, and marketing materials."
+        ),
+        "parameters": {
+            "product": (
+                "str",
+                Field(
+                    ..., description="Detailed product description with key features"
+                ),
+            ),
+            "background": (
+                "str",
+                Field(
+                    default="clean white studio",
+                    description="Background setting with texture details",
+                ),
+            ),
+            "lighting": (
+                "str",
+                Field(
+                    default="soft diffused", description="Professional lighting setup"
+                ),
+            ),
+            "angle": (
+                "str",
+                Field(default="hero shot", description="Camera angle and perspective"),
+            ),
+            "detail_focus": (
+                "str",
+                Field(
+                    default="product features highlighted",
+                    description="Specific details to emphasize",
+                ),
+            ),
+        },
+    },
+    "social_media": {
+        "title": "Social Media Graphics",
+        "description": (
+            "Generate platform-optimized social media graphics with engagement best "
+            "practices."
+        ),
+        "parameters": {
+            "platform": ("str", Field(..., description="Target social media platform")),
+            "content_type": (
+                "str",
+                Field(..., description="Type of social media post"),
+            ),
+            "topic": (
+                "str",
+                Field(..., description="Main topic or subject of the post"),
+            ),
+            "brand_style": (
+                "str",
+                Field(default="modern and clean", description="Brand visual aesthetic"),
+            ),
+            "visual_elements": (
+                "str",
+                Field(
+                    default="geometric shapes and icons",
+                    description="Specific visual elements to include",
+                ),
+            ),
+            "color_scheme": (
+                "str",
+                Field(
+                    default="brand-aligned", description="Color palette for the design"
+                ),
+            ),
+            "layout": (
+                "str",
+                Field(default="balanced", description="Compositional layout"),
+            ),
+            "call_to_action": (
+                "bool",
+                Field(default=False, description="Include call-to-action element"),
+            ),
+        },
+    },
+    "artistic_style": {
+        "title": "Artistic Style Generation",
+        "description": (
+            "Generate images in specific artistic styles and periods. Emulates famous "
+            "artists, art movements, and traditional mediums."
+        ),
+        "parameters": {
+            "subject": (
+                "str",
+                Field(..., description="Main subject with specific details"),
+            ),
+            "setting": (
+                "str",
+                Field(
+                    default="appropriate to style", description="Environmental context"
+                ),
+            ),
+            "artist_style": (
+                "str",
+                Field(
+                    default="impressionist",
+                    description="Specific artist or art movement style",
+                ),
+            ),
+            "medium": (
+                "str",
+                Field(default="oil painting", description="Traditional art medium"),
+            ),
+            "era": (
+                "str",
+                Field(
+                    default="appropriate to style",
+                    description="Historical artistic period",
+                ),
+            ),
+            "atmosphere": (
+                "str",
+                Field(default="evocative", description="Emotional atmosphere"),
+            ),
+            "technique": (
+                "str",
+                Field(
+                    default="masterful brushwork",
+                    description="Specific artistic technique",
+                ),
+            ),
+        },
+    },
+    "og_image": {
+        "title": "Open Graph Images",
+        "description": (
+            "Generate social media preview images optimized for sharing. Creates "
+            "engaging thumbnails for websites and blog posts."
+        ),
+        "parameters": {
+            "title": (
+                "str",
+                Field(..., description="Main title text to display prominently"),
+            ),
+            "brand_name": (
+                "Optional[str]",
+                Field(default=None, description="Website or brand name"),
+            ),
+            "background_style": (
+                "str",
+                Field(default="modern gradient", description="Background visual style"),
+            ),
+            "visual_elements": (
+                "str",
+                Field(
+                    default="subtle design accents",
+                    description="Supporting visual elements",
+                ),
+            ),
+            "text_layout": (
+                "str",
+                Field(default="centered", description="Typography arrangement"),
+            ),
+            "color_scheme": (
+                "str",
+                Field(default="professional", description="Color palette theme"),
+            ),
+        },
+    },
+    "blog_header": {
+        "title": "Blog Header Images",
+        "description": (
+            "Generate header images for blog posts and articles with optional space "
+            "for text overlays."
+        ),
+        "parameters": {
+            "topic": ("str", Field(..., description="Blog post topic or main theme")),
+            "style": (
+                "str",
+                Field(default="modern editorial", description="Visual design style"),
+            ),
+            "visual_metaphor": (
+                "str",
+                Field(
+                    default="abstract concept visualization",
+                    description="Visual representation of the topic",
+                ),
+            ),
+            "mood": ("str", Field(default="engaging", description="Emotional tone")),
+            "lighting": (
+                "str",
+                Field(
+                    default="bright and optimistic", description="Lighting atmosphere"
+                ),
+            ),
+            "color_palette": (
+                "str",
+                Field(default="complementary", description="Color scheme"),
+            ),
+            "include_text_space": (
+                "bool",
+                Field(default=True, description="Reserve space for text overlay"),
+            ),
+        },
+    },
+    "hero_banner": {
+        "title": "Website Hero Banners",
+        "description": (
+            "Generate hero section banners for websites with impactful landing page "
+            "visuals."
+        ),
+        "parameters": {
+            "website_type": ("str", Field(..., description="Type of website")),
+            "main_theme": (
+                "str",
+                Field(..., description="Core theme or main subject of the hero banner"),
+            ),
+            "industry": (
+                "Optional[str]",
+                Field(default=None, description="Industry or market sector"),
+            ),
+            "message": (
+                "Optional[str]",
+                Field(default=None, description="Key value proposition or message"),
+            ),
+            "visual_style": (
+                "str",
+                Field(
+                    default="modern professional",
+                    description="Design aesthetic approach",
+                ),
+            ),
+            "hero_elements": (
+                "str",
+                Field(
+                    default="abstract technology patterns",
+                    description="Main visual elements",
+                ),
+            ),
+            "atmosphere": (
+                "str",
+                Field(
+                    default="innovative and dynamic",
+                    description="Overall feeling and mood",
+                ),
+            ),
+        },
+    },
+    "thumbnail": {
+        "title": "Video Thumbnails",
+        "description": (
+            "Generate engaging thumbnails for video content optimized for high "
+            "click-through rates."
+        ),
+        "parameters": {
+            "content_type": ("str", Field(..., description="Type of video content")),
+            "topic": ("str", Field(..., description="Specific video topic or subject")),
+            "style": (
+                "str",
+                Field(default="bold and dynamic", description="Visual design style"),
+            ),
+            "focal_element": (
+                "str",
+                Field(
+                    default="eye-catching central subject",
+                    description="Main visual focus",
+                ),
+            ),
+            "emotion": ("str", Field(default="exciting", description="Emotional hook")),
+            "color_scheme": (
+                "str",
+                Field(
+                    default="vibrant high-contrast",
+                    description="Color approach for visibility",
+                ),
+            ),
+        },
+    },
+    "infographic": {
+        "title": "Infographic Images",
+        "description": (
+            "Generate information graphics and data visualizations that effectively "
+            "communicate complex data."
+        ),
+        "parameters": {
+            "data_type": ("str", Field(..., description="Type of data or information")),
+            "topic": (
+                "str",
+                Field(..., description="Subject matter of the infographic"),
+            ),
+            "visual_approach": (
+                "str",
+                Field(default="modern clean", description="Design style approach"),
+            ),
+            "chart_types": (
+                "str",
+                Field(
+                    default="mixed visualization elements",
+                    description="Types of data visualizations",
+                ),
+            ),
+            "layout": (
+                "str",
+                Field(default="vertical flow", description="Information organization"),
+            ),
+            "color_scheme": (
+                "str",
+                Field(
+                    default="professional palette", description="Color coding approach"
+                ),
+            ),
+        },
+    },
+    "email_header": {
+        "title": "Email Newsletter Headers",
+        "description": (
+            "Generate header images for email newsletters with branded designs and "
+            "seasonal themes."
+        ),
+        "parameters": {
+            "newsletter_type": (
+                "str",
+                Field(..., description="Type of newsletter content"),
+            ),
+            "main_topic": (
+                "str",
+                Field(
+                    ..., description="Main topic or focus of this newsletter edition"
+                ),
+            ),
+            "brand_name": (
+                "Optional[str]",
+                Field(default=None, description="Company or brand name"),
+            ),
+            "theme": (
+                "Optional[str]",
+                Field(default=None, description="Newsletter theme or campaign"),
+            ),
+            "season": (
+                "Optional[str]",
+                Field(default=None, description="Seasonal context"),
+            ),
+            "visual_style": (
+                "str",
+                Field(default="clean and modern", description="Design aesthetic"),
+            ),
+            "header_elements": (
+                "str",
+                Field(
+                    default="brand elements and patterns",
+                    description="Visual components",
+                ),
+            ),
+        },
+    },
+}
+
+
+async def _generate_from_template(
+    template_id: str, params: dict[str, Any]
+) -> dict[str, Any]:
     """Helper function to generate images from templates.
 
     Args:
         template_id: ID of the template to use
-        **kwargs: Template parameters
+        params: Template parameters, passed through to the renderer as-is
 
     Returns:
         Image generation result with template information
     """
     # Get server context
-    ctx = mcp.get_context()
-    server_ctx = get_server_context(ctx)
+    server_ctx = get_server_context()
 
     # Render the template
-    prompt_text, metadata = template_manager.render_template(template_id, **kwargs)
+    prompt_text = _COMPILED_TEMPLATES[template_id].render(params)
 
     # Generate the image with template information
-    result = await server_ctx.image_generation_tool.generate(
-        prompt=prompt_text,
-        quality=metadata.get("quality", "high"),
-        size=metadata.get("recommended_size", "1024x1024"),
-        style=metadata.get("style", "vivid"),
-    )
-
-    # Add template information
-    result["template_used"] = template_id
-    result["prompt_text"] = prompt_text
-
-    return result
-
-
-@mcp.prompt(
-    name="creative_image",
-    title="Creative Image Generation",
-    description=(
-        "Generate creative images with expert art direction. Combines subject, "
-        "artistic style, mood, and color palette to create vivid, artistic images."
-    ),
-)
-async def creative_image(
-    subject: str = Field(
-        ..., description="Main subject of the image - be specific and detailed"
-    ),
-    style: str = Field(default="digital art", description="Artistic style or medium"),
-    setting: str = Field(
-        default="dramatic environment", description="Environmental setting or location"
-    ),
-    mood: str = Field(default="vibrant", description="Desired mood or emotional tone"),
-    lighting: str = Field(default="dramatic", description="Lighting style"),
-    color_palette: str = Field(
-        default="rich and vibrant", description="Color scheme preference"
-    ),
-    composition: str = Field(default="dynamic", description="Compositional approach"),
-) -> dict[str, Any]:
-    """Generate a creative image directly from parameters."""
-    return await _generate_from_template(
-        "creative_image",
-        subject=subject,
-        style=style,
-        setting=setting,
-        mood=mood,
-        lighting=lighting,
-        color_palette=color_palette,
-        composition=composition,
-    )
-
-
-@mcp.prompt(
-    name="product_photography",
-    title="Product Photography",
-    description=(
-        "Generate professional product photography with commercial specifications. "
-        "Optimized for e-commerce, catalogs, and marketing materials."
-    ),
-)
-async def product_photography(
-    product: str = Field(
-        ..., description="Detailed product description with key features"
-    ),
-    background: str = Field(
-        default="clean white studio",
-        description="Background setting with texture details",
-    ),
-    lighting: str = Field(
-        default="soft diffused", description="Professional lighting setup"
-    ),
-    angle: str = Field(default="hero shot", description="Camera angle and perspective"),
-    detail_focus: str = Field(
-        default="product features highlighted",
-        description="Specific details to emphasize",
-    ),
-) -> dict[str, Any]:
-    """Generate professional product photography directly."""
-    return await _generate_from_template(
-        "product_photography",
-        product=product,
-        background=background,
-        lighting=lighting,
-        angle=angle,
-        detail_focus=detail_focus,
-    )
-
-
-@mcp.prompt(
-    name="social_media",
-    title="Social Media Graphics",
-    description=(
-        "Generate platform-optimized social media graphics with engagement best "
-        "practices."
-    ),
-)
-async def social_media(
-    platform: str = Field(..., description="Target social media platform"),
-    content_type: str = Field(..., description="Type of social media post"),
-    topic: str = Field(..., description="Main topic or subject of the post"),
-    brand_style: str = Field(
-        default="modern and clean", description="Brand visual aesthetic"
-    ),
-    visual_elements: str = Field(
-        default="geometric shapes and icons",
-        description="Specific visual elements to include",
-    ),
-    color_scheme: str = Field(
-        default="brand-aligned", description="Color palette for the design"
-    ),
-    layout: str = Field(default="balanced", description="Compositional layout"),
-    call_to_action: bool = Field(
-        default=False, description="Include call-to-action element"
-    ),
-) -> dict[str, Any]:
-    """Generate social media graphics directly."""
-    return await _generate_from_template(
-        "social_media",
-        platform=platform,
-        content_type=content_type,
-        topic=topic,
-        brand_style=brand_style,
-        visual_elements=visual_elements,
-        color_scheme=color_scheme,
-        layout=layout,
-        call_to_action=call_to_action,
-    )
-
-
-@mcp.prompt(
-    name="artistic_style",
-    title="Artistic Style Generation",
-    description=(
-        "Generate images in specific artistic styles and periods. Emulates famous "
-        "artists, art movements, and traditional mediums."
-    ),
-)
-async def artistic_style(
-    subject: str = Field(..., description="Main subject with specific details"),
-    setting: str = Field(
-        default="appropriate to style", description="Environmental context"
-    ),
-    artist_style: str = Field(
-        default="impressionist", description="Specific artist or art movement style"
-    ),
-    medium: str = Field(default="oil painting", description="Traditional art medium"),
-    era: str = Field(
-        default="appropriate to style", description="Historical artistic period"
-    ),
-    atmosphere: str = Field(default="evocative", description="Emotional atmosphere"),
-    technique: str = Field(
-        default="masterful brushwork", description="Specific artistic technique"
-    ),
-) -> dict[str, Any]:
-    """Generate artistic style images directly."""
-    return await _generate_from_template(
-        "artistic_style",
-        subject=subject,
-        setting=setting,
-        artist_style=artist_style,
-        medium=medium,
-        era=era,
-        atmosphere=atmosphere,
-        technique=technique,
+    result = await server_ctx.generate(
+        prompt=prompt_text, **_TEMPLATE_GENERATION_PARAMS[template_id]
     )
 
+    # Add template information in a new dict so that the result held by the
+    # generation cache is never mutated
+    return {**result, "template_used": template_id, "prompt_text": prompt_text}
 
-@mcp.prompt(
-    name="og_image",
-    title="Open Graph Images",
-    description=(
-        "Generate social media preview images optimized for sharing. Creates "
-        "engaging thumbnails for websites and blog posts."
-    ),
-)
-async def og_image(
-    title: str = Field(..., description="Main title text to display prominently"),
-    brand_name: Optional[str] = Field(
-        default=None, description="Website or brand name"
-    ),
-    background_style: str = Field(
-        default="modern gradient", description="Background visual style"
-    ),
-    visual_elements: str = Field(
-        default="subtle design accents", description="Supporting visual elements"
-    ),
-    text_layout: str = Field(default="centered", description="Typography arrangement"),
-    color_scheme: str = Field(
-        default="professional", description="Color palette theme"
-    ),
-) -> dict[str, Any]:
-    """Generate Open Graph images directly."""
-    return await _generate_from_template(
-        "og_image",
-        title=title,
-        brand_name=brand_name,
-        background_style=background_style,
-        visual_elements=visual_elements,
-        text_layout=text_layout,
-        color_scheme=color_scheme,
-    )
 
+def _build_prompt_handler(template_id: str, parameters: dict[str, Any]):
+    """Generate a prompt handler with a fixed signature for a template.
 
-@mcp.prompt(
-    name="blog_header",
-    title="Blog Header Images",
-    description=(
-        "Generate header images for blog posts and articles with optional space "
-        "for text overlays."
-    ),
-)
-async def blog_header(
-    topic: str = Field(..., description="Blog post topic or main theme"),
-    style: str = Field(default="modern editorial", description="Visual design style"),
-    visual_metaphor: str = Field(
-        default="abstract concept visualization",
-        description="Visual representation of the topic",
-    ),
-    mood: str = Field(default="engaging", description="Emotional tone"),
-    lighting: str = Field(
-        default="bright and optimistic", description="Lighting atmosphere"
-    ),
-    color_palette: str = Field(default="complementary", description="Color scheme"),
-    include_text_space: bool = Field(
-        default=True, description="Reserve space for text overlay"
-    ),
-) -> dict[str, Any]:
-    """Generate blog header images directly."""
-    return await _generate_from_template(
-        "blog_header",
-        topic=topic,
-        style=style,
-        visual_metaphor=visual_metaphor,
-        mood=mood,
-        lighting=lighting,
-        color_palette=color_palette,
-        include_text_space=include_text_space,
-    )
-
-
-@mcp.prompt(
-    name="hero_banner",
-    title="Website Hero Banners",
-    description=(
-        "Generate hero section banners for websites with impactful landing page "
-        "visuals."
-    ),
-)
-async def hero_banner(
-    website_type: str = Field(..., description="Type of website"),
-    main_theme: str = Field(
-        ..., description="Core theme or main subject of the hero banner"
-    ),
-    industry: Optional[str] = Field(
-        default=None, description="Industry or market sector"
-    ),
-    message: Optional[str] = Field(
-        default=None, description="Key value proposition or message"
-    ),
-    visual_style: str = Field(
-        default="modern professional", description="Design aesthetic approach"
-    ),
-    hero_elements: str = Field(
-        default="abstract technology patterns", description="Main visual elements"
-    ),
-    atmosphere: str = Field(
-        default="innovative and dynamic", description="Overall feeling and mood"
-    ),
-) -> dict[str, Any]:
-    """Generate website hero banners directly."""
-    return await _generate_from_template(
-        "hero_banner",
-        website_type=website_type,
-        main_theme=main_theme,
-        industry=industry,
-        message=message,
-        visual_style=visual_style,
-        hero_elements=hero_elements,
-        atmosphere=atmosphere,
-    )
-
-
-@mcp.prompt(
-    name="thumbnail",
-    title="Video Thumbnails",
-    description=(
-        "Generate engaging thumbnails for video content optimized for high "
-        "click-through rates."
-    ),
-)
-async def thumbnail(
-    content_type: str = Field(..., description="Type of video content"),
-    topic: str = Field(..., description="Specific video topic or subject"),
-    style: str = Field(default="bold and dynamic", description="Visual design style"),
-    focal_element: str = Field(
-        default="eye-catching central subject", description="Main visual focus"
-    ),
-    emotion: str = Field(default="exciting", description="Emotional hook"),
-    color_scheme: str = Field(
-        default="vibrant high-contrast", description="Color approach for visibility"
-    ),
-) -> dict[str, Any]:
-    """Generate video thumbnails directly."""
-    return await _generate_from_template(
-        "thumbnail",
-        content_type=content_type,
-        topic=topic,
-        style=style,
-        focal_element=focal_element,
-        emotion=emotion,
-        color_scheme=color_scheme,
+    The handler is compiled from source so FastMCP sees plain typed parameters,
+    and each call packs them into a single dict literal for the renderer.
+    """
+    defaults = f"_TEMPLATE_SCHEMAS[{template_id!r}]['parameters']"
+    signature = ", ".join(
+        f"{name}: {annotation} = {defaults}[{name!r}][1]"
+        for name, (annotation, _) in parameters.items()
     )
-
-
-@mcp.prompt(
-    name="infographic",
-    title="Infographic Images",
-    description=(
-        "Generate information graphics and data visualizations that effectively "
-        "communicate complex data."
-    ),
-)
-async def infographic(
-    data_type: str = Field(..., description="Type of data or information"),
-    topic: str = Field(..., description="Subject matter of the infographic"),
-    visual_approach: str = Field(
-        default="modern clean", description="Design style approach"
-    ),
-    chart_types: str = Field(
-        default="mixed visualization elements",
-        description="Types of data visualizations",
-    ),
-    layout: str = Field(
-        default="vertical flow", description="Information organization"
-    ),
-    color_scheme: str = Field(
-        default="professional palette", description="Color coding approach"
-    ),
-) -> dict[str, Any]:
-    """Generate infographic images directly."""
-    return await _generate_from_template(
-        "infographic",
-        data_type=data_type,
-        topic=topic,
-        visual_approach=visual_approach,
-        chart_types=chart_types,
-        layout=layout,
-        color_scheme=color_scheme,
+    params = ", ".join(f"{name!r}: {name}" for name in parameters)
+    source = (
+        f"async def {template_id}({signature}) -> dict[str, Any]:\n"
+        f'    """Generate an image from the {template_id} template."""\n'
+        f"    return await _generate_from_template({template_id!r}, {{{params}}})\n"
     )
+    exec(source, globals())
+    return globals()[template_id]
+
+
+# Templates are compiled once at import so each prompt call is a single render.
+_COMPILED_TEMPLATES = {
+    template_id: template_manager.compile_template(template_id)
+    for template_id in _TEMPLATE_SCHEMAS
+}
+
+# Generation parameters derived from each template's metadata, with fallbacks
+# applied up front rather than on every call.
+_TEMPLATE_GENERATION_PARAMS = {
+    template_id: {
+        "quality": compiled.metadata.get("quality", "high"),
+        "size": compiled.metadata.get("recommended_size", "1024x1024"),
+        "style": compiled.metadata.get("style", "vivid"),
+    }
+    for template_id, compiled in _COMPILED_TEMPLATES.items()
+}
+
+
+def register_template_prompts(server: FastMCP) -> None:
+    """Register a prompt for every template in the schema table.
+
+    Prompts are built with ``Prompt.from_function`` and added in one pass,
+    without creating a decorator closure for each template. ``from_function``
+    wraps each handler in ``validate_call``, so the parameter validators are
+    compiled once here rather than on every prompt call; the handlers keep
+    flat signatures because MCP prompt arguments are flat string fields.
+    """
+    for template_id, schema in _TEMPLATE_SCHEMAS.items():
+        server.add_prompt(
+            Prompt.from_function(
+                _build_prompt_handler(template_id, schema["parameters"]),
+                name=template_id,
+                title=schema["title"],
+                description=schema["description"],
+            )
+        )
 
 
-@mcp.prompt(
-    name="email_header",
-    title="Email Newsletter Headers",
-    description=(
-        "Generate header images for email newsletters with branded designs and "
-        "seasonal themes."
-    ),
-)
-async def email_header(
-    newsletter_type: str = Field(..., description="Type of newsletter content"),
-    main_topic: str = Field(
-        ..., description="Main topic or focus of this newsletter edition"
-    ),
-    brand_name: Optional[str] = Field(
-        default=None, description="Company or brand name"
-    ),
-    theme: Optional[str] = Field(
-        default=None, description="Newsletter theme or campaign"
-    ),
-    season: Optional[str] = Field(default=None, description="Seasonal context"),
-    visual_style: str = Field(
-        default="clean and modern", description="Design aesthetic"
-    ),
-    header_elements: str = Field(
-        default="brand elements and patterns", description="Visual components"
-    ),
-) -> dict[str, Any]:
-    """Generate email newsletter headers directly."""
-    return await _generate_from_template(
-        "email_header",
-        newsletter_type=newsletter_type,
-        main_topic=main_topic,
-        brand_name=brand_name,
-        theme=theme,
-        season=season,
-        visual_style=visual_style,
-        header_elements=header_elements,
-    )
+register_template_prompts(mcp)
 
 
 def main():
@@ -1339,12 +1580,14 @@ def main():
     # override)
     configure_logging(app_settings.server.log_level)
 
-    logger.info(f"Starting {app_settings.server.name} v{app_settings.server.version}")
-    logger.info(f"Transport: {args.transport}")
+    logger.info(
+        "Starting %s v%s", app_settings.server.name, app_settings.server.version
+    )
+    logger.info("Transport: %s", args.transport)
 
     # Configure FastMCP settings based on command line arguments
     if args.transport in ["sse", "streamable-http"]:
-        logger.info(f"Server will run on {args.host}:{args.port}")
+        logger.info("Server will run on %s:%s", args.host, args.port)
 
         # Configure host and port through FastMCP settings system
         mcp.settings.host = args.host
@@ -1356,6 +1599,8 @@ def main():
             # Note: CORS configuration depends on FastMCP implementation
             # This may need adjustment based on actual FastMCP CORS settings
 
+    install_event_loop_policy()
+
     try:
         # Run server with specified transport
         if args.transport == "stdio":
@@ -1363,18 +1608,24 @@ def main():
             mcp.run(transport="stdio")
         elif args.transport == "sse":
             logger.info("Running with Server-Sent Events (SSE) transport")
-            mcp.run(transport="sse")
+            if args.server == "hypercorn":
+                run_with_hypercorn(mcp.sse_app(), args.host, args.port)
+            else:
+                mcp.run(transport="sse")
         elif args.transport == "streamable-http":
             logger.info("Running with streamable HTTP transport for web deployment")
-            mcp.run(transport="streamable-http")
+            if args.server == "hypercorn":
+                run_with_hypercorn(mcp.streamable_http_app(), args.host, args.port)
+            else:
+                mcp.run(transport="streamable-http")
         else:
-            logger.error(f"Unsupported transport: {args.transport}")
+            logger.error("Unsupported transport: %s", args.transport)
             sys.exit(1)
 
     except KeyboardInterrupt:
         logger.info("Server stopped by user (Ctrl+C)")
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         sys.exit(1)
 
 
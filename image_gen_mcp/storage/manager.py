@@ -1,18 +1,36 @@
 """Image storage management system."""
 
 import asyncio
-import json
-import uuid
-from datetime import datetime, timedelta
+import heapq
+import io
+import os
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Any, Union
-
-import aiofiles
-from PIL import Image
+from time import strftime
+from typing import Any, Optional, Union
 
 from ..config.settings import StorageSettings
+from ..utils.base64_utils import b64decode
+from ..utils.image_utils import read_image_dimensions
+from ..utils.json_utils import dumps_pretty_bytes, loads
 from ..utils.path_utils import build_image_storage_path, find_existing_image_path
 
+# File name suffixes of stored images, as counted by storage statistics
+IMAGE_FILE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp")
+
+# Number of images deleted per worker-thread hop during cleanup
+DELETE_BATCH_SIZE = 64
+
+# Number of day directories read concurrently when listing recent images
+RECENT_SCAN_CONCURRENCY = 8
+
+# Maximum number of parsed metadata documents kept in memory
+METADATA_CACHE_SIZE = 4096
+
+# Maximum number of remembered image file extensions
+IMAGE_EXTENSION_CACHE_SIZE = 4096
+
 
 class ImageStorageManager:
     """Manages local image storage with organized directory structure."""
@@ -24,12 +42,19 @@ class ImageStorageManager:
         self.cache_path = self.base_path / "cache"
         self.logs_path = self.base_path / "logs"
         self._cleanup_task_running = False
+        # Parsed metadata keyed by path, with the (mtime_ns, size) it was read at
+        self._metadata_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+        # Extension of each image_id stored flat by store_image, oldest first
+        self._image_extensions: dict[str, str] = {}
 
     def generate_task_id(self) -> str:
         """Generate a unique task ID."""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        random_part = str(uuid.uuid4()).replace("-", "")[:12]
-        return f"task_{timestamp}_{random_part}"
+        return self._generate_id("task")
+
+    @staticmethod
+    def _generate_id(prefix: str) -> str:
+        """Build ``<prefix>_<local timestamp>_<12 hex chars>``."""
+        return f"{prefix}_{strftime('%Y%m%d%H%M%S')}_{os.urandom(6).hex()}"
 
     async def store_image(
         self, image_id: str, image_data: Union[bytes, str], metadata: dict[str, Any]
@@ -57,15 +82,13 @@ class ImageStorageManager:
         # Determine format
         fmt = metadata.get("format", "png").lower()
         if isinstance(image_data, str) and image_data.startswith("data:image/"):
-            # base64 data URL
-            import base64
-            import re
-
-            match = re.match(r"data:image/(.*?);base64,(.*)", image_data)
-            if not match:
+            # base64 data URL; split the header off without copying the payload
+            # into a regex capture group
+            header, _, payload = image_data.partition(",")
+            fmt = header[len("data:image/") : -len(";base64")].lower()
+            if not header.endswith(";base64") or not fmt:
                 raise ValueError("Invalid data URL")
-            fmt = match.group(1).lower()
-            image_bytes = base64.b64decode(match.group(2))
+            image_bytes = b64decode(payload)
             metadata["source_format"] = "data_url"
         elif isinstance(image_data, bytes):
             image_bytes = image_data
@@ -73,9 +96,6 @@ class ImageStorageManager:
             raise ValueError("Unsupported image data type")
 
         image_path = self.images_path / f"{image_id}.{fmt}"
-        image_path.parent.mkdir(parents=True, exist_ok=True)
-        async with aiofiles.open(image_path, "wb") as f:
-            await f.write(image_bytes)
 
         # Enrich metadata
         enriched = dict(metadata)
@@ -83,59 +103,96 @@ class ImageStorageManager:
         enriched["created_at"] = datetime.now().isoformat()
         enriched["file_size"] = len(image_bytes)
         metadata_path = self.base_path / "metadata" / f"{image_id}.json"
-        metadata_path.parent.mkdir(parents=True, exist_ok=True)
-        async with aiofiles.open(metadata_path, "w") as f:
-            await f.write(json.dumps(enriched, indent=2))
+        await asyncio.to_thread(
+            self._write_image_files, image_path, image_bytes, metadata_path, enriched
+        )
+        self._remember_extension(image_id, fmt)
 
     async def retrieve_image_bytes(self, image_id: str) -> Any:
         """Retrieve image bytes by image_id."""
-        for ext in ("png", "jpg", "jpeg", "webp"):
-            image_path = self.images_path / f"{image_id}.{ext}"
-            if image_path.exists():
-                async with aiofiles.open(image_path, "rb") as f:
-                    return await f.read()
-        return None
+        found = await asyncio.to_thread(self._read_image_file, image_id)
+        return found[1] if found else None
 
     async def retrieve_image_data_url(self, image_id: str) -> Any:
         """Retrieve image as base64 data URL."""
-        import base64
+        return await asyncio.to_thread(self._read_data_url, image_id)
 
-        for ext in ("png", "jpg", "jpeg", "webp"):
-            image_path = self.images_path / f"{image_id}.{ext}"
-            if image_path.exists():
-                async with aiofiles.open(image_path, "rb") as f:
-                    b = await f.read()
-                b64 = base64.b64encode(b).decode()
-                return f"data:image/{ext};base64,{b64}"
+    def _read_image_file(self, image_id: str) -> Optional[tuple[str, bytes]]:
+        """Read an image stored by ``store_image`` (blocking).
+
+        The extension it was last seen with is tried first, and files are
+        opened directly instead of being checked with ``exists()`` first, so
+        a known image costs a single open.
+
+        Returns:
+            (extension, bytes), or None if no file exists for the ID
+        """
+        extensions = ("png", "jpg", "jpeg", "webp")
+        known = self._image_extensions.get(image_id)
+        if known is not None:
+            extensions = (known, *(ext for ext in extensions if ext != known))
+        for ext in extensions:
+            try:
+                data = (self.images_path / f"{image_id}.{ext}").read_bytes()
+            except FileNotFoundError:
+                continue
+            self._remember_extension(image_id, ext)
+            return ext, data
+        self._image_extensions.pop(image_id, None)
         return None
 
+    def _remember_extension(self, image_id: str, ext: str) -> None:
+        """Record the file extension an image is stored under."""
+        self._image_extensions[image_id] = ext
+        if len(self._image_extensions) > IMAGE_EXTENSION_CACHE_SIZE:
+            # Drop the oldest entry; another worker thread may have beaten us
+            try:
+                del self._image_extensions[next(iter(self._image_extensions))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass
+
+    def _read_data_url(self, image_id: str) -> Optional[str]:
+        """Read an image file and encode it as a data URL (blocking).
+
+        Each intermediate buffer is released as soon as the next one is
+        built, so no more than two copies of the payload are alive at once.
+        """
+        import base64
+
+        found = self._read_image_file(image_id)
+        if found is None:
+            return None
+        ext, data = found
+        del found
+        encoded = base64.b64encode(data)
+        del data
+        buffer = bytearray(f"data:image/{ext};base64,".encode())
+        buffer += encoded
+        del encoded
+        return buffer.decode("ascii")
+
     async def get_image_metadata(self, image_id: str) -> Any:
         metadata_path = self.base_path / "metadata" / f"{image_id}.json"
         if not metadata_path.exists():
             return None
         try:
-            async with aiofiles.open(metadata_path) as f:
-                return json.loads(await f.read())
+            return await asyncio.to_thread(self._read_json, metadata_path)
         except Exception:
             return None
 
     async def list_images(self, days: int = None, limit: int = None) -> list:
         """List stored images, optionally filtered by days and/or limit."""
         images = []
-        now = datetime.now()
         metadata_dir = self.base_path / "metadata"
         if not metadata_dir.exists():
             return []
-        for f in metadata_dir.glob("*.json"):
+        cutoff = None if days is None else self._age_cutoff(days)
+        for meta in await asyncio.to_thread(self._read_json_dir, metadata_dir):
             try:
-                async with aiofiles.open(f) as fh:
-                    meta = json.loads(await fh.read())
-                if days is not None:
+                if cutoff is not None:
                     created = meta.get("created_at")
-                    if created:
-                        dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                        if (now - dt).days > days:
-                            continue
+                    if created and created <= cutoff:
+                        continue
                 images.append(meta)
             except Exception:
                 continue
@@ -146,40 +203,81 @@ class ImageStorageManager:
 
     async def delete_image(self, image_id: str) -> bool:
         """Delete image and metadata."""
+        return await asyncio.to_thread(self._delete_image_files, image_id)
+
+    def _delete_image_files(self, image_id: str) -> bool:
+        """Delete an image's files and metadata sidecar (blocking)."""
         found = False
         for ext in ("png", "jpg", "jpeg", "webp"):
             image_path = self.images_path / f"{image_id}.{ext}"
-            if image_path.exists():
+            try:
                 image_path.unlink()
                 found = True
+            except FileNotFoundError:
+                pass
+        self._image_extensions.pop(image_id, None)
         metadata_path = self.base_path / "metadata" / f"{image_id}.json"
-        if metadata_path.exists():
+        self._metadata_cache.pop(metadata_path, None)
+        try:
             metadata_path.unlink()
             found = True
+        except FileNotFoundError:
+            pass
         return found
 
+    def _delete_image_batch(self, image_ids: list[str]) -> int:
+        """Delete several images, skipping any that fail (blocking).
+
+        Returns the number of images processed without an error.
+        """
+        deleted = 0
+        for image_id in image_ids:
+            try:
+                self._delete_image_files(image_id)
+            except Exception:
+                continue
+            deleted += 1
+        return deleted
+
+    async def _delete_images(self, image_ids: list[str]) -> int:
+        """Delete images in batches, one worker hop per batch.
+
+        Awaiting each batch hands control back to the event loop, so a large
+        cleanup does not hold it for the whole unlink storm.
+        """
+        deleted = 0
+        for start in range(0, len(image_ids), DELETE_BATCH_SIZE):
+            batch = image_ids[start : start + DELETE_BATCH_SIZE]
+            deleted += await asyncio.to_thread(self._delete_image_batch, batch)
+        return deleted
+
     async def cleanup_old_images(self) -> int:
         """Delete images older than retention policy."""
         retention_days = getattr(self.settings, "retention_days", 30)
-        now = datetime.now()
-        cleaned = 0
+        cutoff = self._age_cutoff(retention_days)
         metadata_dir = self.base_path / "metadata"
         if not metadata_dir.exists():
             return 0
-        for f in metadata_dir.glob("*.json"):
+        expired = []
+        for meta in await asyncio.to_thread(self._read_json_dir, metadata_dir):
             try:
-                async with aiofiles.open(f) as fh:
-                    meta = json.loads(await fh.read())
                 created = meta.get("created_at")
-                if created:
-                    dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                    if (now - dt).days > retention_days:
-                        image_id = meta.get("image_id")
-                        await self.delete_image(image_id)
-                        cleaned += 1
+                if created and created <= cutoff:
+                    expired.append(meta.get("image_id"))
             except Exception:
                 continue
-        return cleaned
+        return await self._delete_images(expired)
+
+    @staticmethod
+    def _age_cutoff(days: int) -> str:
+        """Return the ISO timestamp at or before which an image is over days old.
+
+        ``created_at`` is written with ``datetime.isoformat``, so comparing the
+        strings orders them like the datetimes without parsing every entry.
+        An image counts as older than ``days`` once ``days + 1`` whole days
+        have passed, matching ``timedelta.days`` truncation.
+        """
+        return (datetime.now() - timedelta(days=days + 1)).isoformat()
 
     async def cleanup_by_size(self) -> int:
         """Delete images if storage exceeds max_size_gb."""
@@ -187,43 +285,40 @@ class ImageStorageManager:
         metadata_dir = self.base_path / "metadata"
         if not metadata_dir.exists():
             return 0
-        images = []
-        for f in metadata_dir.glob("*.json"):
-            try:
-                async with aiofiles.open(f) as fh:
-                    meta = json.loads(await fh.read())
-                images.append(meta)
-            except Exception:
-                continue
+        images = await asyncio.to_thread(self._read_json_dir, metadata_dir)
         images.sort(key=lambda x: x.get("created_at", ""))  # oldest first
 
-        # Calculate initial total size in GB
-        total_size_bytes = 0
-        for ext in ("png", "jpg", "jpeg", "webp"):
-            for img in self.images_path.rglob(f"*.{ext}"):
-                total_size_bytes += img.stat().st_size
+        # Calculate initial total size in GB; the same walk supplies the size
+        # of each file deleted below, so no per-image probing is needed
+        image_stats = await asyncio.to_thread(self._stat_image_files, self.images_path)
+        total_size_bytes = sum(stat.st_size for stat in image_stats.values())
         total_size_gb = total_size_bytes / (1024 * 1024 * 1024)
 
-        cleaned = 0
-        while total_size_gb > max_size_gb and images:
-            meta = images.pop(0)
+        oldest = []
+        for meta in images:
+            if total_size_gb <= max_size_gb:
+                break
             image_id = meta.get("image_id")
-            # Find the image file and get its size before deletion
-            image_file = None
+            image_size_bytes = 0
             for ext in ("png", "jpg", "jpeg", "webp"):
-                candidate = self.images_path / f"{image_id}.{ext}"
-                if candidate.exists():
-                    image_file = candidate
-                    break
-            image_size_bytes = image_file.stat().st_size if image_file else 0
-            await self.delete_image(image_id)
-            # Subtract the deleted file size from total
+                path = os.path.join(self.images_path, f"{image_id}.{ext}")
+                stat = image_stats.get(path)
+                if stat is not None:
+                    image_size_bytes += stat.st_size
+            oldest.append(image_id)
+            # Subtract the file size to be deleted from total
             total_size_gb -= image_size_bytes / (1024 * 1024 * 1024)
-            cleaned += 1
-        return cleaned
+        return await self._delete_images(oldest)
 
     async def initialize(self):
         """Initialize storage directories."""
+        await asyncio.to_thread(self._ensure_directories)
+
+    def _ensure_directories(self) -> None:
+        """Create missing storage directories (blocking).
+
+        Existing directories cost a single stat, so warm starts skip mkdir.
+        """
         for path in [
             self.base_path,
             self.images_path,
@@ -231,6 +326,8 @@ class ImageStorageManager:
             self.logs_path,
             self.base_path / "metadata",
         ]:
+            if path.is_dir():
+                continue
             try:
                 path.mkdir(parents=True, exist_ok=True)
             except (OSError, PermissionError) as e:
@@ -242,11 +339,148 @@ class ImageStorageManager:
                 )
         # For tests, we'll allow this to continue without failing
 
+    @staticmethod
+    def _write_file(path: Path, data: bytes) -> None:
+        """Create the parent directory and write bytes to path (blocking)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def _write_json(self, path: Path, data: dict[str, Any]) -> None:
+        """Serialize data as indented JSON and write it to path (blocking)."""
+        self._write_file(path, dumps_pretty_bytes(data))
+        self._metadata_cache.pop(path, None)
+
+    def _read_json(self, path: Path) -> Any:
+        """Read and parse a JSON file, reusing the last parse if unchanged (blocking).
+
+        Parsed documents are cached by path and validated against the file's
+        mtime and size, so edits made outside the manager are picked up.
+        Documents are returned as shallow copies, so callers can add or
+        replace keys without corrupting the cached parse.
+        """
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._metadata_cache.get(path)
+        if cached is not None and cached[0] == version:
+            return self._copy_document(cached[1])
+
+        data = loads(path.read_bytes())
+        self._metadata_cache[path] = (version, data)
+        if len(self._metadata_cache) > METADATA_CACHE_SIZE:
+            # Drop the oldest entry; another worker thread may have beaten us
+            try:
+                del self._metadata_cache[next(iter(self._metadata_cache))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass
+        return self._copy_document(data)
+
+    @staticmethod
+    def _copy_document(data: Any) -> Any:
+        """Return a shallow copy of a parsed JSON document."""
+        if isinstance(data, dict):
+            return dict(data)
+        if isinstance(data, list):
+            return list(data)
+        return data
+
+    @classmethod
+    def _walk_files(cls, root: Union[Path, str]) -> Iterator[os.DirEntry]:
+        """Recursively yield file entries under root (blocking).
+
+        Uses ``os.scandir`` directly, so no ``Path`` is built per entry and
+        the file type comes from the directory listing. Symlinks are not
+        followed and unreadable directories are skipped.
+        """
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from cls._walk_files(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            return
+
+    @classmethod
+    def _stat_image_files(cls, root: Path) -> dict[str, os.stat_result]:
+        """Stat every stored image file under root in a single walk (blocking).
+
+        Returns the stat results keyed by file path.
+        """
+        return {
+            entry.path: entry.stat()
+            for entry in cls._walk_files(root)
+            if entry.name.endswith(IMAGE_FILE_SUFFIXES)
+        }
+
+    @classmethod
+    def _remove_files_before(cls, root: Path, cutoff: float) -> int:
+        """Delete files under root whose ctime is before cutoff (blocking).
+
+        Image files take their metadata sidecar with them.
+        """
+        cleaned_count = 0
+        for entry in cls._walk_files(root):
+            try:
+                if entry.stat().st_ctime >= cutoff:
+                    continue
+                os.unlink(entry.path)
+                cleaned_count += 1
+
+                # Also remove corresponding metadata file
+                if entry.name.endswith(IMAGE_FILE_SUFFIXES):
+                    metadata_file = os.path.splitext(entry.path)[0] + ".json"
+                    try:
+                        os.unlink(metadata_file)
+                    except FileNotFoundError:
+                        pass
+            except Exception:
+                pass  # Continue cleaning other files
+        return cleaned_count
+
+    def _read_json_dir(self, directory: Path) -> list[Any]:
+        """Read and parse every JSON file in a directory (blocking).
+
+        Files that cannot be read or parsed are skipped.
+        """
+        results = []
+        for path in directory.glob("*.json"):
+            try:
+                results.append(self._read_json(path))
+            except Exception:
+                continue
+        return results
+
+    def _write_image_files(
+        self,
+        image_path: Path,
+        image_data: bytes,
+        metadata_path: Path,
+        metadata: dict[str, Any],
+    ) -> None:
+        """Write an image and its metadata sidecar in one worker hop (blocking)."""
+        self._write_file(image_path, image_data)
+        self._write_json(metadata_path, metadata)
+
+    @staticmethod
+    def _decode_dimensions(data: bytes) -> str:
+        """Read image dimensions by decoding the header with Pillow (blocking).
+
+        Well-formed PNG, JPEG and WebP data is handled by the header parser,
+        so Pillow and its plugin registry are only loaded for the rare image
+        that parser cannot read.
+        """
+        from PIL import Image
+
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                return f"{img.width}x{img.height}"
+        except Exception:
+            return "unknown"
+
     def generate_image_id(self) -> str:
         """Generate a unique image ID."""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        random_part = str(uuid.uuid4()).replace("-", "")[:12]
-        return f"img_{timestamp}_{random_part}"
+        return self._generate_id("img")
 
     def get_image_path(self, image_id: str, file_format: str = "png") -> Path:
         """Get the full path for an image file using date from image_id."""
@@ -278,12 +512,13 @@ class ImageStorageManager:
         image_path = self.get_image_path(image_id, file_format)
         metadata_path = self.get_metadata_path(image_id)
 
-        # Ensure directory exists
-        image_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save image file
-        async with aiofiles.open(image_path, "wb") as f:
-            await f.write(image_data)
+        # Dimensions come from the in-memory header; only formats without a
+        # header fast path need Pillow, which runs in a worker thread
+        size = read_image_dimensions(image_data)
+        if size is not None:
+            dimensions = f"{size[0]}x{size[1]}"
+        else:
+            dimensions = await asyncio.to_thread(self._decode_dimensions, image_data)
 
         # Add file info to metadata
         file_info = {
@@ -291,15 +526,9 @@ class ImageStorageManager:
             "size_bytes": len(image_data),
             "format": file_format.upper(),
             "path": str(image_path),
+            "dimensions": dimensions,
         }
 
-        # Get image dimensions
-        try:
-            with Image.open(image_path) as img:
-                file_info["dimensions"] = f"{img.width}x{img.height}"
-        except Exception:
-            file_info["dimensions"] = "unknown"
-
         # Complete metadata
         complete_metadata = {
             "image_id": image_id,
@@ -308,9 +537,14 @@ class ImageStorageManager:
             **metadata,
         }
 
-        # Save metadata
-        async with aiofiles.open(metadata_path, "w") as f:
-            await f.write(json.dumps(complete_metadata, indent=2))
+        # Save image file and metadata together
+        await asyncio.to_thread(
+            self._write_image_files,
+            image_path,
+            image_data,
+            metadata_path,
+            complete_metadata,
+        )
 
         return image_id, image_path
 
@@ -323,80 +557,90 @@ class ImageStorageManager:
             raise FileNotFoundError(f"Image {image_id} not found")
 
         # Load image data
-        async with aiofiles.open(image_path, "rb") as f:
-            image_data = await f.read()
+        image_data = await asyncio.to_thread(image_path.read_bytes)
 
         # Load metadata
         metadata_path = self.get_metadata_path(image_id)
         if metadata_path.exists():
-            async with aiofiles.open(metadata_path) as f:
-                metadata = json.loads(await f.read())
+            metadata = await asyncio.to_thread(self._read_json, metadata_path)
         else:
             metadata = {"image_id": image_id, "created_at": "unknown"}
 
         return image_data, metadata
 
-    async def get_recent_images(
-        self, limit: int = 10, days: int = 7
-    ) -> list[dict[str, Any]]:
-        """Get recent images within specified time range."""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        recent_images = []
+    async def iter_recent_images(self, days: int = 7) -> AsyncIterator[dict[str, Any]]:
+        """Yield metadata for images stored within the time range, unordered.
 
-        # Search through date-organized directories
-        for year_dir in self.images_path.iterdir():
-            if not year_dir.is_dir() or not year_dir.name.isdigit():
-                continue
+        Only the day directories inside the range are visited; they are named
+        after the image date, so the rest of the tree is never listed. Up to
+        ``RECENT_SCAN_CONCURRENCY`` days are read at once, and results are
+        yielded day by day as they arrive.
+        """
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=days)
 
-            for month_dir in year_dir.iterdir():
-                if not month_dir.is_dir() or not month_dir.name.isdigit():
-                    continue
+        # First day whose midnight falls on or after the cutoff
+        day = cutoff_date.date()
+        if cutoff_date.time() != time.min:
+            day += timedelta(days=1)
 
-                for day_dir in month_dir.iterdir():
-                    if not day_dir.is_dir() or not day_dir.name.isdigit():
-                        continue
+        day_dirs = []
+        while day <= now.date():
+            day_dirs.append(
+                self.images_path / str(day.year) / f"{day.month:02d}" / f"{day.day:02d}"
+            )
+            day += timedelta(days=1)
 
-                    # Check if this directory is within our date range
-                    try:
-                        dir_date = datetime(
-                            int(year_dir.name), int(month_dir.name), int(day_dir.name)
-                        )
-                        if dir_date < cutoff_date:
-                            continue
-                    except ValueError:
-                        continue
+        semaphore = asyncio.Semaphore(RECENT_SCAN_CONCURRENCY)
 
-                    # Look for metadata files
-                    for metadata_file in day_dir.glob("*.json"):
-                        try:
-                            async with aiofiles.open(metadata_file) as f:
-                                metadata = json.loads(await f.read())
-                            recent_images.append(metadata)
-                        except Exception:
-                            continue
+        async def read_day(day_dir: Path) -> list[Any]:
+            # Each day's metadata files are read in a single worker hop; a
+            # missing directory yields nothing
+            async with semaphore:
+                return await asyncio.to_thread(self._read_json_dir, day_dir)
 
-        # Sort by creation date and limit results
-        recent_images.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return recent_images[:limit]
+        tasks = [asyncio.ensure_future(read_day(day_dir)) for day_dir in day_dirs]
+        try:
+            for task in tasks:
+                for metadata in await task:
+                    yield metadata
+        finally:
+            # Stop outstanding reads if the consumer leaves early
+            for task in tasks:
+                task.cancel()
+
+    async def get_recent_images(
+        self, limit: int = 10, days: int = 7
+    ) -> list[dict[str, Any]]:
+        """Get recent images within specified time range, newest first.
+
+        Only the ``limit`` newest rows are kept while scanning, so memory
+        does not grow with the number of stored images. Ties keep scan order.
+        """
+        if limit <= 0:
+            return []
+
+        newest: list[tuple[str, int, dict[str, Any]]] = []
+        index = 0
+        async for metadata in self.iter_recent_images(days):
+            entry = (metadata.get("created_at", ""), -index, metadata)
+            index += 1
+            if len(newest) < limit:
+                heapq.heappush(newest, entry)
+            elif entry[:2] > newest[0][:2]:
+                heapq.heapreplace(newest, entry)
+
+        newest.sort(key=lambda entry: entry[:2], reverse=True)
+        return [metadata for _, _, metadata in newest]
 
     async def get_storage_stats(self) -> dict[str, Any]:
         """Get storage usage statistics."""
-        total_images = 0
-        total_size = 0
-        oldest_date = None
-        newest_date = None
-
-        # Check for all image file types
-        for pattern in ["*.png", "*.jpg", "*.jpeg", "*.webp"]:
-            for image_file in self.images_path.rglob(pattern):
-                total_images += 1
-                total_size += image_file.stat().st_size
-
-                created_time = datetime.fromtimestamp(image_file.stat().st_ctime)
-                if oldest_date is None or created_time < oldest_date:
-                    oldest_date = created_time
-                if newest_date is None or created_time > newest_date:
-                    newest_date = created_time
+        image_stats = await asyncio.to_thread(self._stat_image_files, self.images_path)
+        total_images = len(image_stats)
+        total_size = sum(stat.st_size for stat in image_stats.values())
+        ctimes = [stat.st_ctime for stat in image_stats.values()]
+        oldest_date = datetime.fromtimestamp(min(ctimes)) if ctimes else None
+        newest_date = datetime.fromtimestamp(max(ctimes)) if ctimes else None
 
         return {
             "total_images": total_images,
@@ -411,27 +655,9 @@ class ImageStorageManager:
     async def cleanup_old_files(self) -> int:
         """Clean up files older than retention period."""
         cutoff_date = datetime.now() - timedelta(days=self.settings.retention_days)
-        cleaned_count = 0
-
-        for image_file in self.images_path.rglob("*"):
-            if not image_file.is_file():
-                continue
-
-            created_time = datetime.fromtimestamp(image_file.stat().st_ctime)
-            if created_time < cutoff_date:
-                try:
-                    image_file.unlink()
-                    cleaned_count += 1
-
-                    # Also remove corresponding metadata file
-                    if image_file.suffix in [".png", ".jpg", ".jpeg", ".webp"]:
-                        metadata_file = image_file.with_suffix(".json")
-                        if metadata_file.exists():
-                            metadata_file.unlink()
-                except Exception:
-                    pass  # Continue cleaning other files
-
-        return cleaned_count
+        return await asyncio.to_thread(
+            self._remove_files_before, self.images_path, cutoff_date.timestamp()
+        )
 
     async def start_cleanup_task(self):
         """Start background cleanup task."""
@@ -1,18 +1,32 @@
 """Image editing tool implementation."""
 
-import base64
+import asyncio
+import hashlib
 import logging
 import uuid
-from typing import Any
+from contextlib import nullcontext
+from functools import cached_property
+from typing import Any, Optional
 
 from ..config.settings import Settings
 from ..storage.manager import ImageStorageManager
+from ..utils.base64_utils import b64decode
 from ..utils.cache import CacheManager
-from ..utils.path_utils import build_image_url_path
+from ..utils.inflight import InflightRequests
+from ..utils.openai_client import OpenAIClientManager
+from ..utils.path_utils import build_image_url_path, get_transport_type
+from ..utils.rate_limit import RequestLimiter
 
 logger = logging.getLogger(__name__)
 
 
+def _digest(data: str | None) -> str | None:
+    """Return a short hex fingerprint of a base64 image payload."""
+    if data is None:
+        return None
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
 class ImageEditingTool:
     """Tool for editing images using multiple LLM providers."""
 
@@ -22,19 +36,26 @@ class ImageEditingTool:
         cache_manager: CacheManager,
         settings: Settings,
         openai_client=None,
+        request_limiter: Optional[RequestLimiter] = None,
     ):
         """
         Args:
             storage_manager: ImageStorageManager instance.
             cache_manager: CacheManager instance.
             settings: Settings instance (must have .providers, .images, etc.).
-            openai_client: Optional OpenAI client manager.
+            openai_client: Optional OpenAI client manager; one is created from
+                settings.providers.openai when omitted.
+            request_limiter: Optional limiter applied around API calls.
         """
         self.settings = settings
         self._validate_openai_settings()
         self.storage_manager = storage_manager
         self.cache_manager = cache_manager
-        self.openai_client = openai_client
+        self.openai_client = openai_client or OpenAIClientManager(
+            settings.providers.openai
+        )
+        self.request_limiter = request_limiter or nullcontext()
+        self._inflight = InflightRequests()
 
     def _validate_openai_settings(self):
         """Ensure OpenAI provider settings are present (required for image editing)."""
@@ -56,32 +77,42 @@ class ImageEditingTool:
                 "parameters."
             )
 
+    async def warmup(self) -> None:
+        """Create the OpenAI client before the first edit request."""
+        await self.openai_client.warmup()
+
+    async def close(self) -> None:
+        """Close the OpenAI client."""
+        await self.openai_client.close()
+
     def _get_transport_type(self) -> str:
         """Detect the current transport type from environment or default to stdio."""
-        import sys
+        return get_transport_type()
 
-        # Check if we're running with HTTP transport based on command line args
-        if hasattr(sys, "argv"):
-            for i, arg in enumerate(sys.argv):
-                if arg == "--transport" and i + 1 < len(sys.argv):
-                    return sys.argv[i + 1]
-        # Default to stdio for Claude Desktop integration
-        return "stdio"
+    @cached_property
+    def _base_host(self) -> Optional[str]:
+        """Configured image host without a trailing slash, if any."""
+        base_host = self.settings.images.base_host
+        return base_host.rstrip("/") if base_host else None
+
+    @cached_property
+    def _server_images_url(self) -> str:
+        """Image endpoint of this server for HTTP transports."""
+        server = self.settings.server
+        return f"http://{server.host}:{server.port}/images/"
 
     def _build_image_url(self, image_id: str, file_format: str = "png") -> str:
         """
         Build image URL using base_host setting, server host, or file path
         based on transport.
         """
-        transport_type = self._get_transport_type()
-
-        if self.settings.images.base_host:
+        if self._base_host:
             # Use configured host base (e.g., nginx/CDN URL) with full path
             url_path = build_image_url_path(image_id, file_format)
-            return f"{self.settings.images.base_host.rstrip('/')}/{url_path}"
-        elif transport_type in ["streamable-http", "sse"]:
+            return f"{self._base_host}/{url_path}"
+        elif self._get_transport_type() in ("streamable-http", "sse"):
             # Use MCP server host with HTTP endpoint for HTTP transports
-            return f"http://{self.settings.server.host}:{self.settings.server.port}/images/{image_id}"
+            return f"{self._server_images_url}{image_id}"
         else:
             # For stdio transport, return file path that Claude Desktop can access
             from pathlib import Path
@@ -107,74 +138,110 @@ class ImageEditingTool:
         """Edit an existing image with text instructions."""
 
         # Apply defaults from settings
-        quality = quality or self.settings.images.default_quality
-        size = size or self.settings.images.default_size
-        output_format = output_format or self.settings.images.default_output_format
+        images = self.settings.images
+        quality = quality or images.default_quality
+        size = size or images.default_size
+        output_format = output_format or images.default_output_format
         compression = (
-            compression
-            if compression is not None
-            else self.settings.images.default_compression
+            compression if compression is not None else images.default_compression
         )
 
-        # Generate task ID for tracking
-        task_id = str(uuid.uuid4())
+        # Extract base64 data from data URLs, so both input forms share a key
+        if image_data.startswith("data:"):
+            image_data = image_data.split(",", 1)[1]
+        if mask_data is not None and mask_data.startswith("data:"):
+            mask_data = mask_data.split(",", 1)[1]
 
-        # Check cache first (using hash of image data)
+        # Check cache first. The payloads are fingerprinted once here so the
+        # cache and in-flight keys never serialize or rehash multi-MB strings
         cache_params = {
-            "image_data": image_data,
+            "image_hash": _digest(image_data),
             "prompt": prompt,
-            "mask_data": mask_data,
+            "mask_hash": _digest(mask_data),
             "quality": quality,
             "size": size,
             "output_format": output_format,
             "compression": compression,
             "background": background,
-            "model": self.settings.images.default_model,
+            "model": images.default_model,
         }
 
         cached_result = await self.cache_manager.get_image_edit(**cache_params)
         if cached_result:
-            logger.info(f"Returning cached edit result for prompt: {prompt[:50]}...")
+            logger.info("Returning cached edit result for prompt: %.50s...", prompt)
             return cached_result
 
-        try:
-            # Validate image data format
-            if image_data.startswith("data:"):
-                # Extract base64 data from data URL
-                image_data = image_data.split(",", 1)[1]
+        # Share the upstream call with concurrent identical requests
+        return await self._inflight.run(
+            tuple(cache_params.items()),
+            lambda: self._edit_uncached(image_data, mask_data, cache_params),
+        )
 
+    async def _edit_uncached(
+        self,
+        image_data: str,
+        mask_data: str | None,
+        cache_params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Edit with the OpenAI API, store the image and cache the result."""
+        prompt = cache_params["prompt"]
+        quality = cache_params["quality"]
+        size = cache_params["size"]
+        output_format = cache_params["output_format"]
+        compression = cache_params["compression"]
+        background = cache_params["background"]
+        model = cache_params["model"]
+
+        # Generate task ID for tracking; cache hits and callers joining an
+        # in-flight edit never reach this point
+        task_id = str(uuid.uuid4())
+
+        try:
             # Edit image using OpenAI API
-            logger.info(f"Editing image for task {task_id}")
-            response = await self.openai_client.edit_image(
-                image_data=image_data,
-                prompt=prompt,
-                mask_data=mask_data,
-                model=self.settings.images.default_model,
-                quality=quality,
-                size=size,
-                output_format=output_format,
-                compression=compression,
-                background=background,
-                n=1,
-            )
+            logger.info("Editing image for task %s", task_id)
+            async with self.request_limiter:
+                response = await self.openai_client.edit_image(
+                    image_data=image_data,
+                    prompt=prompt,
+                    mask_data=mask_data,
+                    model=model,
+                    quality=quality,
+                    size=size,
+                    output_format=output_format,
+                    compression=compression,
+                    background=background,
+                    n=1,
+                )
 
-            # Process the first (and only) edited image
-            edited_image_data = response.data[0]
+            # Take the first (and only) edited image and the response details,
+            # then drop the response so its base64 payload is freed once decoded
+            b64_json = response.data[0].b64_json
+            usage = getattr(response, "usage", None)
+            api_response = {
+                "created": getattr(response, "created", None),
+                "size": getattr(response, "size", size),
+                "quality": getattr(response, "quality", quality),
+                "output_format": getattr(response, "output_format", output_format),
+                "background": getattr(response, "background", background),
+            }
+            del response
 
-            # Decode base64 image data
-            image_bytes = base64.b64decode(edited_image_data.b64_json)
+            # Decode base64 image data in a worker thread; multi-MB payloads
+            # would otherwise stall every other request on the event loop
+            image_bytes = await asyncio.to_thread(b64decode, b64_json)
+            del b64_json
 
             # Estimate cost
             cost_info = self.openai_client.estimate_cost(prompt, 1)
 
             # Add actual usage if available
-            if hasattr(response, "usage") and response.usage:
+            if usage:
                 cost_info.update(
                     {
                         "actual_usage": {
-                            "total_tokens": response.usage.total_tokens,
-                            "input_tokens": response.usage.input_tokens,
-                            "output_tokens": response.usage.output_tokens,
+                            "total_tokens": usage.total_tokens,
+                            "input_tokens": usage.input_tokens,
+                            "output_tokens": usage.output_tokens,
                         }
                     }
                 )
@@ -186,7 +253,7 @@ class ImageEditingTool:
                 "prompt": prompt,
                 "has_mask": mask_data is not None,
                 "parameters": {
-                    "model": self.settings.images.default_model,
+                    "model": model,
                     "quality": quality,
                     "size": size,
                     "output_format": output_format,
@@ -194,13 +261,7 @@ class ImageEditingTool:
                     "background": background,
                 },
                 "cost_info": cost_info,
-                "api_response": {
-                    "created": getattr(response, "created", None),
-                    "size": getattr(response, "size", size),
-                    "quality": getattr(response, "quality", quality),
-                    "output_format": getattr(response, "output_format", output_format),
-                    "background": getattr(response, "background", background),
-                },
+                "api_response": api_response,
             }
 
             # Save to local storage
@@ -237,9 +298,9 @@ class ImageEditingTool:
             # Cache the result with URL
             await self.cache_manager.set_image_edit(result, **cache_params)
 
-            logger.info(f"Successfully edited image {image_id} for task {task_id}")
+            logger.info("Successfully edited image %s for task %s", image_id, task_id)
             return result
 
         except Exception as e:
-            logger.error(f"Error editing image for task {task_id}: {e}")
+            logger.error("Error editing image for task %s: %s", task_id, e)
             raise RuntimeError(f"Image editing failed: {str(e)}") from e
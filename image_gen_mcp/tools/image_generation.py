@@ -1,12 +1,16 @@
 """Image generation tool implementation."""
 
+import asyncio
 import logging
 import uuid
+from contextlib import nullcontext
+from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Optional
 
 from ..config.settings import Settings
-from ..providers.base import ProviderConfig, ProviderError
+from ..providers.base import LLMProvider, ProviderConfig, ProviderError
 from ..providers.gemini import GeminiProvider
 from ..providers.openai import OpenAIProvider
 from ..providers.registry import ProviderRegistry
@@ -20,11 +24,18 @@ from ..types.enums import (
     OutputFormat,
 )
 from ..utils.cache import CacheManager
-from ..utils.path_utils import build_image_url_path
+from ..utils.inflight import InflightRequests
+from ..utils.path_utils import build_image_url_path, get_transport_type
+from ..utils.rate_limit import RequestLimiter
 
 logger = logging.getLogger(__name__)
 
 
+def _param_str(value: Enum | str) -> str:
+    """Return the string value of an enum member or plain parameter."""
+    return value.value if isinstance(value, Enum) else str(value)
+
+
 class ImageGenerationTool:
     """Tool for generating images using multiple LLM providers."""
 
@@ -34,6 +45,7 @@ class ImageGenerationTool:
         cache_manager: CacheManager,
         settings: Settings,
         openai_client=None,
+        request_limiter: Optional[RequestLimiter] = None,
     ):
         """
         Args:
@@ -41,12 +53,17 @@ class ImageGenerationTool:
             cache_manager: CacheManager instance.
             settings: Settings instance (must have .providers, .images, etc.).
             openai_client: Optional OpenAI client.
+            request_limiter: Optional limiter applied around provider calls.
         """
         self.settings = settings
         self.storage_manager = storage_manager
         self.cache_manager = cache_manager
         self.provider_registry = ProviderRegistry()
         self.openai_client = openai_client
+        self.request_limiter = request_limiter or nullcontext()
+        self._inflight = InflightRequests()
+        # Background warmup and the first request may both register providers
+        self._registration_lock = asyncio.Lock()
         self._initialize_providers()
 
     def _initialize_providers(self) -> None:
@@ -99,8 +116,10 @@ class ImageGenerationTool:
 
     async def _ensure_providers_registered(self) -> None:
         """Ensure all providers are registered."""
-        if hasattr(self, "_pending_providers"):
-            for provider in self._pending_providers:
+        if not getattr(self, "_pending_providers", None):
+            return
+        async with self._registration_lock:
+            for provider in getattr(self, "_pending_providers", []):
                 try:
                     await self.provider_registry.register_provider(provider)
                 except Exception as e:
@@ -110,30 +129,32 @@ class ImageGenerationTool:
 
     def _get_transport_type(self) -> str:
         """Detect the current transport type from environment or default to stdio."""
-        import sys
+        return get_transport_type()
+
+    @cached_property
+    def _base_host(self) -> Optional[str]:
+        """Configured image host without a trailing slash, if any."""
+        base_host = self.settings.images.base_host
+        return base_host.rstrip("/") if base_host else None
 
-        # Check if we're running with HTTP transport based on command line args
-        if hasattr(sys, "argv"):
-            for i, arg in enumerate(sys.argv):
-                if arg == "--transport" and i + 1 < len(sys.argv):
-                    return sys.argv[i + 1]
-        # Default to stdio for Claude Desktop integration
-        return "stdio"
+    @cached_property
+    def _server_images_url(self) -> str:
+        """Image endpoint of this server for HTTP transports."""
+        server = self.settings.server
+        return f"http://{server.host}:{server.port}/images/"
 
     def _build_image_url(self, image_id: str, file_format: str = "png") -> str:
         """
         Build image URL using base_host setting, server host, or file path
         based on transport.
         """
-        transport_type = self._get_transport_type()
-
-        if self.settings.images.base_host:
+        if self._base_host:
             # Use configured host base (e.g., nginx/CDN URL) with full path
             url_path = build_image_url_path(image_id, file_format)
-            return f"{self.settings.images.base_host.rstrip('/')}/{url_path}"
-        elif transport_type in ["streamable-http", "sse"]:
+            return f"{self._base_host}/{url_path}"
+        elif self._get_transport_type() in ("streamable-http", "sse"):
             # Use MCP server host with HTTP endpoint for HTTP transports
-            return f"http://{self.settings.server.host}:{self.settings.server.port}/images/{image_id}"
+            return f"{self._server_images_url}{image_id}"
         else:
             # For stdio transport, return file path that Claude Desktop can access
             from ..utils.path_utils import build_image_storage_path
@@ -180,26 +201,12 @@ class ImageGenerationTool:
         await self._ensure_providers_registered()
 
         # Convert enums to string values for API calls
-        quality_str = (
-            quality.value if isinstance(quality, ImageQuality) else str(quality)
-        )
-        size_str = size.value if isinstance(size, ImageSize) else str(size)
-        style_str = style.value if isinstance(style, ImageStyle) else str(style)
-        moderation_str = (
-            moderation.value
-            if isinstance(moderation, ModerationLevel)
-            else str(moderation)
-        )
-        output_format_str = (
-            output_format.value
-            if isinstance(output_format, OutputFormat)
-            else str(output_format)
-        )
-        background_str = (
-            background.value
-            if isinstance(background, BackgroundType)
-            else str(background)
-        )
+        quality_str = _param_str(quality)
+        size_str = _param_str(size)
+        style_str = _param_str(style)
+        moderation_str = _param_str(moderation)
+        output_format_str = _param_str(output_format)
+        background_str = _param_str(background)
 
         # Determine which model to use
         target_model = model or self._get_default_model()
@@ -228,9 +235,6 @@ class ImageGenerationTool:
                 "available or misconfigured"
             )
 
-        # Generate task ID for tracking
-        task_id = str(uuid.uuid4())
-
         # Build parameters for caching and validation
         params = {
             "prompt": prompt,
@@ -247,33 +251,69 @@ class ImageGenerationTool:
         # Check cache first
         cached_result = await self.cache_manager.get_image_generation(**params)
         if cached_result:
-            logger.info(f"Returning cached result for prompt: {prompt[:50]}...")
+            logger.info("Returning cached result for prompt: %.50s...", prompt)
             return cached_result
 
+        # Share the upstream call with concurrent identical requests
+        return await self._inflight.run(
+            tuple(params.items()),
+            lambda: self._generate_uncached(provider, params),
+        )
+
+    async def _generate_uncached(
+        self, provider: LLMProvider, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Generate with the provider, store the image and cache the result."""
+        prompt = params["prompt"]
+        target_model = params["model"]
+        quality_str = params["quality"]
+        size_str = params["size"]
+        style_str = params["style"]
+        moderation_str = params["moderation"]
+        output_format_str = params["output_format"]
+        compression = params["compression"]
+        background_str = params["background"]
+
+        # Generate task ID for tracking; cache hits and callers joining an
+        # in-flight generation never reach this point
+        task_id = str(uuid.uuid4())
+
         try:
             # Validate parameters for the specific model
             validated_params = self.provider_registry.validate_model_request(
                 target_model, params
             )
 
+            # Resolve the effective values once for the request, storage and result
+            quality_str = validated_params.get("quality", quality_str)
+            size_str = validated_params.get("size", size_str)
+            style_str = validated_params.get("style", style_str)
+            moderation_str = validated_params.get("moderation", moderation_str)
+            output_format_str = validated_params.get("output_format", output_format_str)
+            compression = validated_params.get("compression", compression)
+            background_str = validated_params.get("background", background_str)
+
             # Generate image using the provider
             logger.info(
-                f"Generating image for task {task_id} using model {target_model} "
-                f"via {provider.name}"
+                "Generating image for task %s using model %s via %s",
+                task_id,
+                target_model,
+                provider.name,
             )
 
-            provider_response = await provider.generate_image(
-                model=target_model,
-                prompt=prompt,
-                quality=validated_params.get("quality", quality_str),
-                size=validated_params.get("size", size_str),
-                style=validated_params.get("style", style_str),
-                moderation=validated_params.get("moderation", moderation_str),
-                output_format=validated_params.get("output_format", output_format_str),
-                compression=validated_params.get("compression", compression),
-                background=validated_params.get("background", background_str),
-                n=1,
-            )
+            async with self.request_limiter:
+                provider_response = await provider.generate_image(
+                    model=target_model,
+                    prompt=prompt,
+                    quality=quality_str,
+                    size=size_str,
+                    style=style_str,
+                    moderation=moderation_str,
+                    output_format=output_format_str,
+                    compression=compression,
+                    background=background_str,
+                    n=1,
+                )
 
             # Estimate cost
             cost_info = provider.estimate_cost(target_model, prompt, 1)
@@ -293,13 +333,11 @@ class ImageGenerationTool:
             image_id, image_path = await self.storage_manager.save_image(
                 image_data=provider_response.image_data,
                 metadata=metadata,
-                file_format=validated_params.get("output_format", output_format_str),
+                file_format=output_format_str,
             )
 
             # Build image URL instead of base64 data
-            image_url = self._build_image_url(
-                image_id, validated_params.get("output_format", output_format_str)
-            )
+            image_url = self._build_image_url(image_id, output_format_str)
 
             # Prepare result
             result = {
@@ -310,22 +348,18 @@ class ImageGenerationTool:
                 "metadata": {
                     "model": target_model,
                     "provider": provider.name,
-                    "size": validated_params.get("size", size_str),
-                    "quality": validated_params.get("quality", quality_str),
-                    "style": validated_params.get("style", style_str),
-                    "moderation": validated_params.get("moderation", moderation_str),
-                    "output_format": validated_params.get(
-                        "output_format", output_format_str
-                    ),
-                    "background": validated_params.get("background", background_str),
+                    "size": size_str,
+                    "quality": quality_str,
+                    "style": style_str,
+                    "moderation": moderation_str,
+                    "output_format": output_format_str,
+                    "background": background_str,
                     "prompt": prompt,
                     "created_at": metadata.get("created_at"),
                     "cost_estimate": cost_info.get("estimated_cost_usd"),
                     "file_size_bytes": len(provider_response.image_data),
-                    "dimensions": validated_params.get("size", size_str),
-                    "format": validated_params.get(
-                        "output_format", output_format_str
-                    ).upper(),
+                    "dimensions": size_str,
+                    "format": output_format_str.upper(),
                 },
             }
 
@@ -333,22 +367,44 @@ class ImageGenerationTool:
             await self.cache_manager.set_image_generation(result, **params)
 
             logger.info(
-                f"Successfully generated image {image_id} for task {task_id} "
-                f"using {provider.name}"
+                "Successfully generated image %s for task %s using %s",
+                image_id,
+                task_id,
+                provider.name,
             )
             return result
 
         except ProviderError as e:
-            logger.error(f"Provider error for task {task_id}: {e}")
+            logger.error("Provider error for task %s: %s", task_id, e)
             raise RuntimeError(f"Image generation failed: {str(e)}")
         except Exception as e:
-            logger.error(f"Error generating image for task {task_id}: {e}")
+            logger.error("Error generating image for task %s: %s", task_id, e)
             raise RuntimeError(f"Image generation failed: {str(e)}")
 
     def get_supported_models(self) -> dict[str, Any]:
         """Get information about all supported models."""
         return self.provider_registry.get_registry_stats()
 
+    async def warmup(self) -> None:
+        """Register providers and open their connections ahead of first use."""
+        await self._ensure_providers_registered()
+        await asyncio.gather(
+            *(
+                provider.warmup()
+                for provider in self.provider_registry.get_available_providers()
+            ),
+            return_exceptions=True,
+        )
+
+    async def close(self) -> None:
+        """Close provider connections, including any not yet registered."""
+        pending = getattr(self, "_pending_providers", [])
+        await asyncio.gather(
+            self.provider_registry.close(),
+            *(provider.close() for provider in pending),
+            return_exceptions=True,
+        )
+
     def get_available_providers(self) -> list[str]:
         """Get list of available provider names."""
         return [
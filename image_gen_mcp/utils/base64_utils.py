@@ -0,0 +1,21 @@
+"""Base64 helpers for decoding image payloads."""
+
+import base64
+from typing import Union
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - pybase64 is an optional speedup
+    pybase64 = None
+
+
+def b64decode(data: Union[bytes, str]) -> bytes:
+    """Decode standard base64 image data.
+
+    Uses pybase64 when it is installed, whose SIMD decoder is several times
+    faster on multi-megabyte images, and falls back to the standard library.
+    Characters outside the base64 alphabet are discarded in both cases.
+    """
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=False)
+    return base64.b64decode(data)
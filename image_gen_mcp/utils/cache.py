@@ -1,39 +1,57 @@
 """Cache management for the MCP server."""
 
 import hashlib
-import json
 import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 from ..config.settings import CacheSettings
+from .json_utils import dumps_sorted_bytes
+
+# Inserts between full sweeps for expired entries; a sweep also runs whenever
+# an insert needs space, so expired entries are never evicted in place of live ones
+CLEANUP_INTERVAL = 128
 
 
 class MemoryCache:
     """Simple in-memory cache with TTL support."""
 
     def __init__(self, max_size_mb: int = 500, default_ttl: int = 3600):
-        self.cache: dict[str, dict[str, Any]] = {}
+        # Entries in least-recently-used order, oldest first
+        self.cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.default_ttl = default_ttl
         self.current_size = 0
+        self._sets_since_cleanup = 0
 
     def _is_expired(self, entry: dict[str, Any]) -> bool:
         """Check if cache entry is expired."""
         return time.time() > entry["expires_at"]
 
     def _estimate_size(self, data: Any) -> int:
-        """Estimate the size of data in bytes."""
+        """Estimate the size of data in bytes.
+
+        Containers are walked rather than serialized, so measuring a result
+        never copies the strings it holds.
+        """
         if isinstance(data, str):
-            return len(data.encode("utf-8"))
+            # isascii() is a flag check, so only non-ASCII text is encoded
+            return len(data) if data.isascii() else len(data.encode("utf-8"))
         elif isinstance(data, bytes):
             return len(data)
         elif isinstance(data, dict):
-            return len(json.dumps(data).encode("utf-8"))
+            return sum(
+                self._estimate_size(key) + self._estimate_size(value)
+                for key, value in data.items()
+            )
+        elif isinstance(data, (list, tuple)):
+            return sum(self._estimate_size(item) for item in data)
         else:
             return len(str(data).encode("utf-8"))
 
     def _cleanup_expired(self):
         """Remove expired entries."""
+        self._sets_since_cleanup = 0
         current_time = time.time()
         expired_keys = [
             key
@@ -47,20 +65,12 @@ class MemoryCache:
 
     def _evict_lru(self, needed_size: int):
         """Evict least recently used entries to make space."""
-        if not self.cache:
-            return
-
-        # Sort by last access time
-        sorted_entries = sorted(self.cache.items(), key=lambda x: x[1]["last_accessed"])
-
+        # The dict is kept in access order, so the oldest entries come first
         freed_size = 0
-        for key, entry in sorted_entries:
-            if freed_size >= needed_size:
-                break
-
+        while self.cache and freed_size < needed_size:
+            _, entry = self.cache.popitem(last=False)
             freed_size += entry["size"]
             self.current_size -= entry["size"]
-            del self.cache[key]
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
@@ -73,8 +83,8 @@ class MemoryCache:
             self.current_size -= entry["size"]
             return None
 
-        # Update last accessed time
-        entry["last_accessed"] = time.time()
+        # Mark as most recently used; dict order is the only recency record
+        self.cache.move_to_end(key)
         return entry["data"]
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -82,9 +92,6 @@ class MemoryCache:
         if ttl is None:
             ttl = self.default_ttl
 
-        # Clean up expired entries first
-        self._cleanup_expired()
-
         # Estimate size of new entry
         data_size = self._estimate_size(value)
         entry_size = data_size + len(key.encode("utf-8")) + 100  # overhead
@@ -93,14 +100,22 @@ class MemoryCache:
         if entry_size > self.max_size_bytes:
             return False  # Entry too large
 
+        # Clean up expired entries periodically, or before evicting live ones
+        self._sets_since_cleanup += 1
+        if (
+            self._sets_since_cleanup >= CLEANUP_INTERVAL
+            or entry_size > self.max_size_bytes - self.current_size
+        ):
+            self._cleanup_expired()
+
         # Make space if needed
         available_space = self.max_size_bytes - self.current_size
         if entry_size > available_space:
             self._evict_lru(entry_size - available_space)
 
-        # Remove existing entry if present
-        if key in self.cache:
-            old_entry = self.cache[key]
+        # Remove existing entry if present, so the new one goes to the end
+        old_entry = self.cache.pop(key, None)
+        if old_entry is not None:
             self.current_size -= old_entry["size"]
 
         # Add new entry
@@ -109,7 +124,6 @@ class MemoryCache:
             "data": value,
             "size": entry_size,
             "created_at": current_time,
-            "last_accessed": current_time,
             "expires_at": current_time + ttl,
         }
         self.current_size += entry_size
@@ -166,10 +180,24 @@ class CacheManager:
 
     def _make_key(self, prefix: str, **kwargs) -> str:
         """Create a cache key from parameters."""
-        # Sort kwargs for consistent keys
-        sorted_kwargs = sorted(kwargs.items())
-        key_data = json.dumps([prefix, sorted_kwargs], sort_keys=True)
-        return hashlib.sha256(key_data.encode()).hexdigest()[:32]
+        # Sorted keys give consistent keys. Keys never leave the process, so the
+        # faster BLAKE2b stands in for SHA-256; 128 bits keeps collisions
+        # negligible
+        key_data = dumps_sorted_bytes([prefix, kwargs])
+        return hashlib.blake2b(key_data, digest_size=16).hexdigest()
+
+    def _make_edit_key(self, params: dict[str, Any]) -> str:
+        """Create an edit cache key, fingerprinting any raw image data."""
+        # Don't include actual image data in key, use hash
+        cache_params = {k: v for k, v in params.items() if k != "image_data"}
+        if "image_data" in params:
+            image_data = params["image_data"]
+            if isinstance(image_data, str):
+                image_data = image_data.encode()
+            image_hash = hashlib.blake2b(image_data, digest_size=8).hexdigest()
+            cache_params["image_hash"] = image_hash
+
+        return self._make_key("image_edit", **cache_params)
 
     async def initialize(self):
         """Initialize cache backend."""
@@ -196,13 +224,7 @@ class CacheManager:
         if not self.enabled:
             return None
 
-        # Don't include actual image data in key, use hash
-        cache_params = {k: v for k, v in params.items() if k != "image_data"}
-        if "image_data" in params:
-            image_hash = hashlib.sha256(params["image_data"].encode()).hexdigest()[:16]
-            cache_params["image_hash"] = image_hash
-
-        key = self._make_key("image_edit", **cache_params)
+        key = self._make_edit_key(params)
         return self.cache.get(key)
 
     async def set_image_edit(self, result: dict[str, Any], **params) -> bool:
@@ -210,13 +232,7 @@ class CacheManager:
         if not self.enabled:
             return False
 
-        # Don't include actual image data in key, use hash
-        cache_params = {k: v for k, v in params.items() if k != "image_data"}
-        if "image_data" in params:
-            image_hash = hashlib.sha256(params["image_data"].encode()).hexdigest()[:16]
-            cache_params["image_hash"] = image_hash
-
-        key = self._make_key("image_edit", **cache_params)
+        key = self._make_edit_key(params)
         return self.cache.set(key, result)
 
     async def clear(self):
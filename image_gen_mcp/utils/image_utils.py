@@ -0,0 +1,98 @@
+"""Lightweight image header parsing."""
+
+import struct
+from typing import Optional
+
+from .validators import (
+    JPEG_SIGNATURE,
+    PNG_SIGNATURE,
+    WEBP_RIFF_SIGNATURE,
+    WEBP_WEBP_SIGNATURE,
+)
+
+# JPEG start-of-frame markers carrying the frame dimensions (DHT, JPG and DAC
+# share the range but are not frames)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# JPEG markers that stand alone without a length field
+_JPEG_STANDALONE_MARKERS = frozenset({0x01, *range(0xD0, 0xD9)})
+
+
+def _png_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """Read dimensions from the PNG IHDR chunk."""
+    if len(data) < 24 or data[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", data[16:24])
+
+
+def _jpeg_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """Scan JPEG segments up to the first start-of-frame marker."""
+    offset = 2
+    length = len(data)
+    while offset + 4 <= length:
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            # Fill byte before the marker
+            offset += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        (segment_length,) = struct.unpack(">H", data[offset + 2 : offset + 4])
+        if marker in _JPEG_SOF_MARKERS:
+            if offset + 9 > length:
+                return None
+            height, width = struct.unpack(">HH", data[offset + 5 : offset + 9])
+            return width, height
+        offset += 2 + segment_length
+    return None
+
+
+def _webp_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """Read dimensions from the first WebP chunk (VP8, VP8L or VP8X)."""
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        if data[23:26] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        if data[20] != 0x2F:
+            return None
+        (bits,) = struct.unpack("<I", data[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def read_image_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """
+    Read image width and height from PNG, JPEG or WebP header bytes.
+
+    Only the header is inspected, so no decoder is loaded and no pixel data
+    is touched.
+
+    Args:
+        data: Encoded image bytes
+
+    Returns:
+        (width, height), or None if the format is unsupported or the header
+        cannot be parsed
+    """
+    try:
+        if data.startswith(PNG_SIGNATURE):
+            return _png_dimensions(data)
+        if data.startswith(JPEG_SIGNATURE):
+            return _jpeg_dimensions(data)
+        if data.startswith(WEBP_RIFF_SIGNATURE) and data[8:12] == WEBP_WEBP_SIGNATURE:
+            return _webp_dimensions(data)
+    except struct.error:
+        return None
+    return None
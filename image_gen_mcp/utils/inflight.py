@@ -0,0 +1,40 @@
+"""Coalescing of concurrent identical requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class InflightRequests:
+    """Share a single running task among concurrent callers with the same key.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same task instead of repeating the upstream call.
+    The task is shielded so one caller being cancelled does not cancel the
+    work for the others.
+    """
+
+    def __init__(self):
+        self._tasks: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await the in-flight task for key, starting it with factory if needed."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._discard(key, done))
+        return await asyncio.shield(task)
+
+    def _discard(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        """Forget a finished task."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved; waiting callers re-raise it
+            task.exception()
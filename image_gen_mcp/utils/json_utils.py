@@ -0,0 +1,45 @@
+"""JSON serialization helpers for MCP resource payloads and stored metadata."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+if orjson is not None:
+    # Match the standard library, which accepts non-string keys
+    _PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def dumps_pretty(data: Any) -> str:
+    """Serialize data as indented JSON text.
+
+    Uses orjson when it is installed, which is considerably faster on large
+    payloads such as base64 data URLs, and falls back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=_PRETTY_OPTIONS).decode()
+    return json.dumps(data, indent=2)
+
+
+def dumps_pretty_bytes(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, ready to be written to a file."""
+    if orjson is not None:
+        return orjson.dumps(data, option=_PRETTY_OPTIONS)
+    return json.dumps(data, indent=2).encode()
+
+
+def dumps_sorted_bytes(data: Any) -> bytes:
+    """Serialize data as compact UTF-8 JSON with sorted keys, for hashing."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or text, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,6 +1,7 @@
 """OpenAI API client manager with retry logic and error handling."""
 
-import base64
+import asyncio
+import importlib.util
 import logging
 from typing import Any
 
@@ -9,9 +10,14 @@ from openai import AsyncOpenAI
 from openai.types.images_response import ImagesResponse
 
 from ..config.settings import OpenAISettings
+from .base64_utils import b64decode
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for image downloads. HTTP/2 is used when the optional ``h2``
+# package (``httpx[http2]``) is installed.
+DOWNLOAD_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class OpenAIClientManager:
@@ -20,6 +26,7 @@ class OpenAIClientManager:
     def __init__(self, settings: OpenAISettings):
         self.settings = settings
         self._client = None
+        self._http_client: httpx.AsyncClient | None = None
 
     @property
     def client(self):
@@ -28,14 +35,49 @@ class OpenAIClientManager:
         return self._client
 
     def _create_client(self):
+        client_kwargs = {}
+        if self.settings.http_transport == "aiohttp":
+            # aiohttp holds up better under concurrent requests; imported lazily
+            # because it needs the optional aiohttp extra (openai[aiohttp])
+            from openai import DefaultAioHttpClient
+
+            client_kwargs["http_client"] = DefaultAioHttpClient(
+                timeout=self.settings.timeout
+            )
         return AsyncOpenAI(
             api_key=self.settings.api_key,
             organization=self.settings.organization,
             base_url=self.settings.base_url,
             timeout=self.settings.timeout,
             max_retries=self.settings.max_retries,
+            **client_kwargs,
         )
 
+    async def warmup(self) -> None:
+        """Create the API client and its connection pool ahead of first use."""
+        _ = self.client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client for image downloads, created on first use."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=DOWNLOAD_LIMITS,
+                timeout=self.settings.timeout,
+                follow_redirects=True,
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the API and download clients, if they were created."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     async def generate_image(
         self,
         prompt: str,
@@ -77,7 +119,7 @@ class OpenAIClientManager:
         try:
             logger.info(f"Generating image with prompt: {prompt[:100]}...")
             logger.debug(f"Request parameters: {list(request_params.keys())}")
-            response = await self._client.images.generate(**request_params)
+            response = await self.client.images.generate(**request_params)
 
             logger.info(f"Successfully generated {len(response.data)} image(s)")
             return response
@@ -101,12 +143,13 @@ class OpenAIClientManager:
     ) -> ImagesResponse:
         """Edit an image using OpenAI's Images API."""
 
-        # Convert base64 strings to bytes if needed
+        # Convert base64 strings to bytes if needed, decoding multi-MB payloads
+        # in a worker thread so they do not stall the event loop
         if isinstance(image_data, str):
             if image_data.startswith("data:"):
                 # Handle data URLs
-                image_data = image_data.split(",", 1)[1]
-            image_bytes = base64.b64decode(image_data)
+                image_data = image_data.partition(",")[2]
+            image_bytes = await asyncio.to_thread(b64decode, image_data)
         else:
             image_bytes = image_data
 
@@ -114,8 +157,8 @@ class OpenAIClientManager:
         if mask_data:
             if isinstance(mask_data, str):
                 if mask_data.startswith("data:"):
-                    mask_data = mask_data.split(",", 1)[1]
-                mask_bytes = base64.b64decode(mask_data)
+                    mask_data = mask_data.partition(",")[2]
+                mask_bytes = await asyncio.to_thread(b64decode, mask_data)
             else:
                 mask_bytes = mask_data
 
@@ -148,7 +191,7 @@ class OpenAIClientManager:
             logger.info(f"Editing image with prompt: {prompt[:100]}...")
             logger.debug(f"Request parameters: {list(request_params.keys())}")
             logger.debug("API client configured for image editing")
-            response = await self._client.images.edit(**request_params)
+            response = await self.client.images.edit(**request_params)
 
             logger.info(
                 f"Successfully edited image, generated {len(response.data)} result(s)"
@@ -185,7 +228,6 @@ class OpenAIClientManager:
 
     async def download_image(self, image_url: str) -> bytes:
         """Download image from URL (for dall-e models that return URLs)."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(image_url)
-            response.raise_for_status()
-            return response.content
+        response = await self.http_client.get(image_url)
+        response.raise_for_status()
+        return response.content
@@ -1,6 +1,8 @@
 """Path utilities for image storage and URL generation."""
 
+import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -60,6 +62,22 @@ def build_image_storage_path(
     return date_path / f"{image_id}.{file_format.lower()}"
 
 
+@lru_cache(maxsize=1)
+def get_transport_type() -> str:
+    """
+    Detect the transport from the command line, defaulting to stdio.
+
+    The arguments do not change once the server is running, so they are
+    scanned only on the first call.
+    """
+    argv = getattr(sys, "argv", [])
+    for i, arg in enumerate(argv[:-1]):
+        if arg == "--transport":
+            return argv[i + 1]
+    # Default to stdio for Claude Desktop integration
+    return "stdio"
+
+
 def build_image_url_path(image_id: str, file_format: str = "png") -> str:
     """
     Build the URL path for an image including date structure.
@@ -0,0 +1,51 @@
+"""Concurrency and rate limiting for upstream image API requests."""
+
+import asyncio
+import time
+
+
+class RequestLimiter:
+    """Async context manager that bounds concurrent and per-minute requests.
+
+    A semaphore caps the number of requests in flight, and a token bucket
+    refilled at ``requests_per_minute / 60`` tokens per second smooths bursts
+    so callers queue instead of running into provider 429 responses.
+    """
+
+    def __init__(self, max_concurrent: int = 5, requests_per_minute: int = 50):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._capacity = float(max(requests_per_minute, 0))
+        self._tokens = self._capacity
+        self._refill_rate = self._capacity / 60.0
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def _acquire_token(self) -> None:
+        """Wait until a request token is available and consume it."""
+        if self._refill_rate <= 0:
+            return  # Rate limiting disabled
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated_at) * self._refill_rate,
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+
+    async def __aenter__(self) -> "RequestLimiter":
+        await self._semaphore.acquire()
+        try:
+            await self._acquire_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
@@ -1,6 +1,10 @@
 """Utility functions for parameter validation and fault tolerance."""
 
+import base64
+import functools
 import logging
+import re
+import sys
 from typing import Any, Optional, TypeVar
 
 from ..types.enums import (
@@ -12,6 +16,9 @@ from ..types.enums import (
     OutputFormat,
 )
 
+# Standard base64 alphabet with optional trailing padding
+_BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/]*=*")
+
 # Image format magic number signatures
 PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
 JPEG_SIGNATURE = b'\xff\xd8\xff'
@@ -59,47 +66,15 @@ def normalize_enum_value(
     # Convert to string for comparison
     str_value = str(value).strip()
 
-    # Try exact match first (case-insensitive by default for robustness)
-    for enum_member in enum_class:
-        if (case_sensitive and enum_member.value == str_value) or (
-            not case_sensitive and enum_member.value.lower() == str_value.lower()
-        ):
-            return enum_member
-
-    # Try enum name match (case-insensitive)
-    if not case_sensitive:
-        str_value_upper = str_value.upper()
+    if case_sensitive:
         for enum_member in enum_class:
-            if enum_member.name.upper() == str_value_upper:
+            if enum_member.value == str_value:
                 return enum_member
-
-    # Try partial matching for common variations
-    if not case_sensitive:
-        str_value_lower = str_value.lower()
-
-        # Check common aliases first
-        aliases = get_common_aliases(enum_class)
-        if str_value_lower in aliases:
-            target_value = aliases[str_value_lower]
-            for enum_member in enum_class:
-                if enum_member.value == target_value:
-                    return enum_member
-
-        for enum_member in enum_class:
-            # Handle common size format variations
-            if enum_class.__name__ == "ImageSize":
-                if "x" in str_value_lower:
-                    if enum_member.value == str_value_lower:
-                        return enum_member
-                elif str_value_lower in ["square", "1024", "1024x1024"]:
-                    if enum_member.value == "1024x1024":
-                        return enum_member
-                elif str_value_lower in ["landscape", "wide", "1536x1024"]:
-                    if enum_member.value == "1536x1024":
-                        return enum_member
-                elif str_value_lower in ["portrait", "tall", "1024x1536"]:
-                    if enum_member.value == "1024x1536":
-                        return enum_member
+    else:
+        # Values, names and aliases are resolved with a single dict lookup
+        enum_member = _enum_lookup(enum_class).get(str_value.lower())
+        if enum_member is not None:
+            return enum_member
 
     # Log the invalid value with helpful suggestion
     valid_values = [e.value for e in enum_class]
@@ -115,6 +90,42 @@ def normalize_enum_value(
     return default or next(iter(enum_class))
 
 
+# Size variations accepted for ImageSize in addition to values and names
+_SIZE_VARIATIONS = {
+    "square": "1024x1024",
+    "1024": "1024x1024",
+    "landscape": "1536x1024",
+    "wide": "1536x1024",
+    "portrait": "1024x1536",
+    "tall": "1024x1536",
+}
+
+
+@functools.cache
+def _enum_lookup(enum_class: type[T]) -> dict[str, T]:
+    """Build a case-insensitive lookup table for an enum class.
+
+    Entries are added in matching priority order: values, then member names,
+    then common aliases, then size variations for ImageSize.
+    """
+    members_by_value = {enum_member.value: enum_member for enum_member in enum_class}
+    lookup: dict[str, T] = {}
+
+    for enum_member in enum_class:
+        lookup.setdefault(enum_member.value.lower(), enum_member)
+    for enum_member in enum_class:
+        lookup.setdefault(enum_member.name.lower(), enum_member)
+
+    aliases = dict(get_common_aliases(enum_class))
+    if enum_class.__name__ == "ImageSize":
+        aliases.update(_SIZE_VARIATIONS)
+    for alias, target_value in aliases.items():
+        if target_value in members_by_value:
+            lookup.setdefault(alias, members_by_value[target_value])
+
+    return lookup
+
+
 def get_common_aliases(enum_class: type) -> dict[str, str]:
     """Get common aliases for enum values based on enum type."""
 
@@ -275,6 +286,27 @@ def validate_days(value: Any, max_days: int = 365) -> int:
         return 7
 
 
+# Conservative prompt length limit (OpenAI has limits)
+MAX_PROMPT_LENGTH = 4000
+
+# Longest raw prompt kept in the normalization cache, so oversized inputs
+# cannot pin large strings in memory
+MAX_CACHED_PROMPT_LENGTH = 2 * MAX_PROMPT_LENGTH
+
+
+def _normalize_prompt(prompt: str) -> tuple[str, int]:
+    """Strip and truncate a prompt, returning it with its stripped length.
+
+    The normalized text is interned so stored metadata shares one copy.
+    """
+    stripped = prompt.strip()
+    return sys.intern(stripped[:MAX_PROMPT_LENGTH]), len(stripped)
+
+
+# Cached on the raw prompt so repeated prompts skip the work
+_normalize_prompt_cached = functools.lru_cache(maxsize=512)(_normalize_prompt)
+
+
 def sanitize_prompt(prompt: str) -> str:
     """
     Sanitize and validate prompt text.
@@ -291,21 +323,20 @@ def sanitize_prompt(prompt: str) -> str:
     if not prompt or not isinstance(prompt, str):
         raise ValueError("Prompt must be a non-empty string")
 
-    # Strip whitespace
-    prompt = prompt.strip()
+    if len(prompt) <= MAX_CACHED_PROMPT_LENGTH:
+        sanitized, length = _normalize_prompt_cached(prompt)
+    else:
+        sanitized, length = _normalize_prompt(prompt)
 
-    if not prompt:
+    if not sanitized:
         raise ValueError("Prompt cannot be empty")
 
-    # Check length (OpenAI has limits)
-    max_length = 4000  # Conservative limit
-    if len(prompt) > max_length:
+    if length > MAX_PROMPT_LENGTH:
         logger.warning(
-            f"Prompt truncated from {len(prompt)} to {max_length} characters"
+            "Prompt truncated from %d to %d characters", length, MAX_PROMPT_LENGTH
         )
-        prompt = prompt[:max_length]
 
-    return prompt
+    return sanitized
 
 
 def _is_webp_format(image_bytes: bytes) -> bool:
@@ -345,10 +376,47 @@ def _detect_image_format(image_bytes: bytes) -> str:
         return 'image/png'
 
 
+# Largest decoded image accepted for editing (the OpenAI Images API limit)
+MAX_IMAGE_BYTES = 50 * 1024 * 1024
+
+# Base64 length of a MAX_IMAGE_BYTES payload, checked before any decoding
+MAX_BASE64_LENGTH = (MAX_IMAGE_BYTES + 2) // 3 * 4
+
+
+def _check_base64_length(data: str) -> None:
+    """Reject base64 payloads that would decode to more than MAX_IMAGE_BYTES."""
+    if len(data) > MAX_BASE64_LENGTH:
+        raise ValueError(
+            f"Image data exceeds the {MAX_IMAGE_BYTES // (1024 * 1024)} MB limit"
+        )
+
+
+def _is_valid_base64(data: str) -> bool:
+    """Check base64 syntax without decoding the payload.
+
+    Accepts what ``base64.b64decode(data, validate=True)`` accepts on Python
+    3.11 and 3.12, except empty input: a non-empty body in the standard
+    alphabet whose final quantum is completed by exactly the padding it
+    needs. Padding after a complete quantum is ignored, as by the decoder.
+    """
+    if _BASE64_PATTERN.fullmatch(data) is None:
+        return False
+    body_length = len(data.rstrip("="))
+    if body_length == 0:
+        return False
+    remainder = body_length % 4
+    padding = len(data) - body_length
+    return remainder == 0 or (remainder > 1 and padding == 4 - remainder)
+
+
 def validate_base64_image(data: str) -> str:
     """
     Validate base64 image data.
 
+    The payload is checked syntactically and only its leading bytes are
+    decoded to detect the image format, so large uploads are not copied.
+    Payloads over ``MAX_IMAGE_BYTES`` are rejected from their length alone.
+
     Args:
         data: Base64 encoded image data
 
@@ -356,25 +424,22 @@ def validate_base64_image(data: str) -> str:
         Validated base64 data
 
     Raises:
-        ValueError: If data is invalid
+        ValueError: If data is invalid or too large
     """
-    if not isinstance(data, str) or not data.strip():
+    if not isinstance(data, str) or not data or data.isspace():
         raise ValueError("Image data must be a non-empty string")
 
-    import base64
-
     # If already a data URL, validate and return as is
     if data.startswith("data:"):
-        try:
-            prefix, b64 = data.split(",", 1)
-            base64.b64decode(b64, validate=True)
-            return data
-        except Exception:
+        _, separator, b64 = data.partition(",")
+        _check_base64_length(b64)
+        if not separator or not _is_valid_base64(b64):
             raise ValueError("Invalid data URL")
+        return data
     # If raw base64, validate and return as data URL
-    try:
-        image_bytes = base64.b64decode(data, validate=True)
-        mime_type = _detect_image_format(image_bytes)
-        return f"data:{mime_type};base64,{data}"
-    except Exception as e:
-        raise ValueError(f"Invalid base64 image data: {e}")
+    _check_base64_length(data)
+    if not _is_valid_base64(data):
+        raise ValueError("Invalid base64 image data: Non-base64 digit or padding")
+    # 16 base64 characters decode to the 12 bytes the signatures need
+    mime_type = _detect_image_format(base64.b64decode(data[:16]))
+    return f"data:{mime_type};base64,{data}"
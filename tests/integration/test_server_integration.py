@@ -1,5 +1,6 @@
 """Integration tests for the MCP server and resource management."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -55,6 +56,26 @@ class TestImageResourceManager:
         data = json.loads(result)
         assert data["error"] == "Image nonexistent_123 not found"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_image_resource_requests_share_load(
+        self, resource_manager, storage_manager, sample_image_bytes
+    ):
+        """Test concurrent fetches of one image read and encode it once."""
+        image_id, _ = await storage_manager.save_image(
+            image_data=sample_image_bytes, metadata={"prompt": "shared"}
+        )
+
+        with patch.object(
+            storage_manager, "load_image", wraps=storage_manager.load_image
+        ) as load_image:
+            results = await asyncio.gather(
+                *(resource_manager.get_image_resource(image_id) for _ in range(5))
+            )
+
+        assert load_image.call_count == 1
+        assert len(set(results)) == 1
+        assert json.loads(results[0])["image_id"] == image_id
+
     @pytest.mark.asyncio
     async def test_get_recent_images(
         self, resource_manager, storage_manager, sample_image_bytes
@@ -372,6 +393,8 @@ class TestServerIntegration:
 
         mock_server_context.image_generation_tool = mock_generation_tool
         mock_server_context.image_editing_tool = mock_editing_tool
+        mock_server_context.generate = mock_generation_tool.generate
+        mock_server_context.edit = mock_editing_tool.edit
 
         mock_context.request_context.lifespan_context = mock_server_context
         mock_mcp.get_context.return_value = mock_context
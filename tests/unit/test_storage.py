@@ -118,6 +118,15 @@ class TestImageStorageManager:
         assert stored_metadata["prompt"] == "base64 test"
         assert stored_metadata["source_format"] == "data_url"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "data_url", ["data:image/png,iVBORw0KGgo=", "data:image/;base64,iVBORw0KGgo="]
+    )
+    async def test_store_image_invalid_data_url(self, storage_manager, data_url):
+        """Test that data URLs without a base64 image header are rejected."""
+        with pytest.raises(ValueError, match="Invalid data URL"):
+            await storage_manager.store_image("test_bad_url", data_url, {})
+
     @pytest.mark.asyncio
     async def test_retrieve_image(self, storage_manager, sample_image_bytes):
         """Test retrieving stored images."""
@@ -140,6 +149,52 @@ class TestImageStorageManager:
         assert retrieved_metadata["prompt"] == "retrieve test"
         assert "created_at" in retrieved_metadata
 
+    @pytest.mark.asyncio
+    async def test_retrieve_image_after_format_change(
+        self, storage_manager, sample_image_bytes
+    ):
+        """Test a remembered extension is dropped once its file is gone."""
+        await storage_manager.store_image(
+            "moved_image", sample_image_bytes, {"format": "png"}
+        )
+        assert await storage_manager.retrieve_image_bytes("moved_image")
+
+        # Replace the PNG with a WebP behind the manager's back
+        images_path = storage_manager.base_path / "images"
+        (images_path / "moved_image.png").rename(images_path / "moved_image.webp")
+
+        data_url = await storage_manager.retrieve_image_data_url("moved_image")
+        assert data_url.startswith("data:image/webp;base64,")
+
+    @pytest.mark.asyncio
+    async def test_metadata_cache_tracks_file_changes(
+        self, storage_manager, sample_image_bytes
+    ):
+        """Test cached metadata is reused until the file changes on disk."""
+        await storage_manager.store_image(
+            "cached_meta", sample_image_bytes, {"prompt": "first"}
+        )
+
+        first = await storage_manager.get_image_metadata("cached_meta")
+        assert await storage_manager.get_image_metadata("cached_meta") == first
+
+        # Changing a returned document leaves the cached parse untouched
+        first["prompt"] = "changed by a caller"
+        again = await storage_manager.get_image_metadata("cached_meta")
+        assert again["prompt"] == "first"
+
+        # Edit the file behind the manager's back
+        metadata_path = storage_manager.base_path / "metadata" / "cached_meta.json"
+        metadata = json.loads(metadata_path.read_text())
+        metadata["prompt"] = "edited outside the manager"
+        metadata_path.write_text(json.dumps(metadata, indent=2))
+
+        edited = await storage_manager.get_image_metadata("cached_meta")
+        assert edited["prompt"] == "edited outside the manager"
+
+        await storage_manager.delete_image("cached_meta")
+        assert await storage_manager.get_image_metadata("cached_meta") is None
+
     @pytest.mark.asyncio
     async def test_retrieve_nonexistent_image(self, storage_manager):
         """Test retrieving non-existent images."""
@@ -211,6 +266,22 @@ class TestImageStorageManager:
         limited_images = await storage_manager.list_images(limit=1)
         assert len(limited_images) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_recent_images(self, storage_manager, sample_image_bytes):
+        """Test recent images are returned newest first and capped by limit."""
+        saved_ids = []
+        for i in range(4):
+            image_id, _ = await storage_manager.save_image(
+                sample_image_bytes, {"prompt": f"recent {i}"}
+            )
+            saved_ids.append(image_id)
+
+        recent = await storage_manager.get_recent_images(limit=2, days=1)
+        assert [img["image_id"] for img in recent] == saved_ids[:1:-1]
+
+        everything = await storage_manager.get_recent_images(limit=10, days=1)
+        assert [img["image_id"] for img in everything] == saved_ids[::-1]
+
     @pytest.mark.asyncio
     async def test_delete_image(self, storage_manager, sample_image_bytes):
         """Test deleting stored images."""
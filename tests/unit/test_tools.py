@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -22,8 +23,12 @@ def mock_generation_tool(storage_manager, cache_manager, mock_settings):
 
 
 @pytest.fixture
-def mock_editing_tool(storage_manager, cache_manager, mock_settings):
+def mock_editing_tool(
+    storage_manager, cache_manager, mock_settings, mock_openai_settings
+):
     """Fixture for creating an ImageEditingTool with mocked dependencies."""
+    # Image editing requires the OpenAI provider settings
+    mock_settings.providers.openai = mock_openai_settings
     tool = ImageEditingTool(
         storage_manager=storage_manager,
         cache_manager=cache_manager,
@@ -440,6 +445,88 @@ class TestImageEditingTool:
         assert "image_url" in result
         mock_editing_tool.openai_client.edit_image.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_edit_image_cache_key_uses_hashes(
+        self, mock_editing_tool, sample_image_data
+    ):
+        """Test that cache lookups receive payload fingerprints, not payloads."""
+        cached = {"image_id": "cached_id"}
+        mock_editing_tool.cache_manager.get_image_edit = AsyncMock(return_value=cached)
+
+        result = await mock_editing_tool.edit(
+            image_data=sample_image_data, prompt="edit test"
+        )
+
+        assert result is cached
+        params = mock_editing_tool.cache_manager.get_image_edit.call_args.kwargs
+        assert "image_data" not in params
+        assert "mask_data" not in params
+        assert len(params["image_hash"]) == 32
+        assert params["mask_hash"] is None
+        mock_editing_tool.openai_client.edit_image.assert_not_called()
+
+        # The same image as raw base64 maps to the same key
+        await mock_editing_tool.edit(
+            image_data=sample_image_data.split(",", 1)[1], prompt="edit test"
+        )
+        raw_params = mock_editing_tool.cache_manager.get_image_edit.call_args.kwargs
+        assert raw_params == params
+
+        # A mask is keyed by its own fingerprint alongside the image's
+        await mock_editing_tool.edit(
+            image_data=sample_image_data,
+            prompt="edit test",
+            mask_data=sample_image_data,
+        )
+        mask_params = mock_editing_tool.cache_manager.get_image_edit.call_args.kwargs
+        assert "mask_data" not in mask_params
+        assert mask_params["image_hash"] == params["image_hash"]
+        assert mask_params["mask_hash"] == params["image_hash"]
+
+        # Data URL and raw base64 masks map to the same key as well
+        await mock_editing_tool.edit(
+            image_data=sample_image_data,
+            prompt="edit test",
+            mask_data=sample_image_data.split(",", 1)[1],
+        )
+        raw_mask_params = (
+            mock_editing_tool.cache_manager.get_image_edit.call_args.kwargs
+        )
+        assert raw_mask_params == mask_params
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_edits_share_api_call(
+        self, mock_editing_tool, sample_image_data
+    ):
+        """Test that identical edits in flight together call the API once."""
+        mock_editing_tool.cache_manager.get_image_edit = AsyncMock(return_value=None)
+        mock_editing_tool.cache_manager.set_image_edit = AsyncMock()
+        mock_editing_tool.storage_manager.save_image = AsyncMock(
+            return_value=("test_id", "/path/to/image")
+        )
+        mock_editing_tool._build_image_url = MagicMock(
+            return_value="http://localhost:3001/images/test_id.png"
+        )
+
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(b64_json=sample_image_data.split(",", 1)[1])]
+        mock_response.usage = None
+
+        async def slow_edit(**kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        mock_editing_tool.openai_client.edit_image = AsyncMock(side_effect=slow_edit)
+
+        first, second = await asyncio.gather(
+            mock_editing_tool.edit(image_data=sample_image_data, prompt="same edit"),
+            mock_editing_tool.edit(image_data=sample_image_data, prompt="same edit"),
+        )
+
+        assert first == second
+        mock_editing_tool.openai_client.edit_image.assert_called_once()
+        mock_editing_tool.storage_manager.save_image.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_edit_image_with_mask(self, mock_editing_tool, sample_image_data):
         """Test image editing with a mask."""
@@ -1,7 +1,12 @@
 """Unit tests for utility functions including validators, cache, and OpenAI client."""
 
+import asyncio
+import base64
+import binascii
+import io
+import json
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,17 +18,26 @@ from image_gen_mcp.types.enums import (
     ModerationLevel,
     OutputFormat,
 )
+from image_gen_mcp.utils import base64_utils, json_utils
 from image_gen_mcp.utils.cache import CacheManager, MemoryCache
+from image_gen_mcp.utils.image_utils import read_image_dimensions
+from image_gen_mcp.utils.inflight import InflightRequests
 from image_gen_mcp.utils.openai_client import OpenAIClientManager
+from image_gen_mcp.utils.rate_limit import RequestLimiter
 from image_gen_mcp.utils.validators import (
     BMP_SIGNATURE,
     GIF_SIGNATURE,
     JPEG_SIGNATURE,
+    MAX_BASE64_LENGTH,
+    MAX_CACHED_PROMPT_LENGTH,
+    MAX_PROMPT_LENGTH,
     PNG_SIGNATURE,
     WEBP_RIFF_SIGNATURE,
     WEBP_WEBP_SIGNATURE,
     _detect_image_format,
+    _is_valid_base64,
     _is_webp_format,
+    _normalize_prompt_cached,
     normalize_enum_value,
     sanitize_prompt,
     validate_background_type,
@@ -248,6 +262,26 @@ class TestPromptSanitization:
         sanitized = sanitize_prompt(prompt_with_unicode_space)
         assert sanitized.strip() == "test\u2000prompt\u2001here"
 
+    def test_sanitize_prompt_repeated_calls(self, caplog):
+        """Test repeated prompts reuse the cached result and still warn."""
+        first = sanitize_prompt("  repeated prompt  ")
+        assert sanitize_prompt("  repeated prompt  ") is first
+
+        long_prompt = "y" * 4500
+        with caplog.at_level("WARNING"):
+            sanitize_prompt(long_prompt)
+            sanitize_prompt(long_prompt)
+        truncations = [r for r in caplog.records if "truncated" in r.getMessage()]
+        assert len(truncations) == 2
+
+    def test_sanitize_prompt_oversized_input_not_cached(self):
+        """Test that oversized prompts are normalized without being cached."""
+        huge_prompt = "z" * (MAX_CACHED_PROMPT_LENGTH + 1)
+        before = _normalize_prompt_cached.cache_info().currsize
+
+        assert sanitize_prompt(huge_prompt) == "z" * MAX_PROMPT_LENGTH
+        assert _normalize_prompt_cached.cache_info().currsize == before
+
 
 class TestBase64ImageValidation:
     """Test base64 image validation functionality."""
@@ -299,6 +333,16 @@ class TestBase64ImageValidation:
         with pytest.raises(ValueError, match="Invalid data URL"):
             validate_base64_image("data:invalid-format")
 
+    def test_validate_base64_image_rejects_oversize_payload(self):
+        """Test that payloads over the size limit fail before decoding."""
+        oversize = "A" * (MAX_BASE64_LENGTH + 4)
+
+        with pytest.raises(ValueError, match="exceeds the 50 MB limit"):
+            validate_base64_image(oversize)
+
+        with pytest.raises(ValueError, match="exceeds the 50 MB limit"):
+            validate_base64_image(f"data:image/png;base64,{oversize}")
+
     def test_validate_base64_image_malformed_data_url(self):
         """Test validation with malformed data URLs."""
         with pytest.raises(ValueError, match="Invalid data URL"):
@@ -307,6 +351,62 @@ class TestBase64ImageValidation:
         with pytest.raises(ValueError, match="Invalid data URL"):
             validate_base64_image("data:image/png;base64,invalid!")
 
+    @pytest.mark.parametrize(
+        "data",
+        [
+            "QUJD",
+            "QUI=",
+            "QQ==",
+            "QUJDRA==",
+            "QUJDREU=",
+            "9+BA",
+            "/+8=",
+            "Q",
+            "QQ",
+            "QUI",
+            "QUJDR",
+            "QQ=",
+            "QQ===",
+            "Q===",
+            "QU=I",
+            "QUJD=Q==",
+            "QUJDR===",
+            "QUJDRA=",
+            "QUJ*",
+            "QUJ D",
+        ],
+    )
+    def test_is_valid_base64_matches_stdlib(self, data):
+        """Test that syntax checking agrees with the validating decoder."""
+        try:
+            base64.b64decode(data, validate=True)
+            expected = True
+        except binascii.Error:
+            expected = False
+        assert _is_valid_base64(data) is expected
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ("=", False),
+            ("==", False),
+            ("QUI==", False),
+            ("9+BA==", True),
+            ("9+BA===", True),
+        ],
+    )
+    def test_is_valid_base64_padding(self, data, expected):
+        """Test padding-only input and padding counts on the final quantum."""
+        assert _is_valid_base64(data) is expected
+
+    def test_validate_base64_image_rejects_padding_only(self):
+        """Test that padding without any data is not accepted as an image."""
+        with pytest.raises(ValueError, match="Invalid base64"):
+            validate_base64_image("=")
+
+        with pytest.raises(ValueError, match="Invalid data URL"):
+            validate_base64_image("data:image/png;base64,==")
+
 
 class TestMemoryCache:
     """Test memory cache implementation."""
@@ -399,6 +499,46 @@ class TestMemoryCache:
         assert stats["size_mb"] > 0
         assert cache.current_size > 0
 
+    def test_memory_cache_size_estimation_walks_containers(self):
+        """Test that nested results are measured without serialization."""
+        cache = MemoryCache()
+
+        result = {"image_id": "abc", "tags": ["x" * 100, 5], "note": "é"}
+
+        # Keys and values are summed; non-ASCII text counts its UTF-8 bytes
+        expected = len("image_id") + 3 + len("tags") + 100 + 1 + len("note") + 2
+        assert cache._estimate_size(result) == expected
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Test that eviction drops the least recently read entries first."""
+        cache = MemoryCache()
+        cache.max_size_bytes = 1000
+
+        for key in ("a", "b", "c", "d"):
+            assert cache.set(key, "x" * 100)
+        cache.get("a")  # "b" is now the least recently used
+
+        cache.set("e", "x" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "x" * 100
+        assert cache.current_size == sum(e["size"] for e in cache.cache.values())
+
+    def test_memory_cache_sweeps_expired_before_evicting(self):
+        """Test that expired entries make room before live entries are evicted."""
+        cache = MemoryCache()
+        cache.max_size_bytes = 1000
+
+        for key in ("a", "b", "c"):
+            assert cache.set(key, "x" * 100)
+        cache.set("stale", "x" * 100, ttl=-1)  # Already expired
+
+        cache.set("d", "x" * 100)
+
+        assert "stale" not in cache.cache
+        assert cache.get("a") == "x" * 100
+        assert cache.current_size == sum(e["size"] for e in cache.cache.values())
+
     def test_memory_cache_clear(self):
         """Test cache clearing."""
         cache = MemoryCache()
@@ -526,6 +666,41 @@ class TestCacheManager:
         finally:
             await cache_manager.close()
 
+    @pytest.mark.asyncio
+    async def test_cache_manager_edit_accepts_bytes_image_data(
+        self, mock_cache_settings
+    ):
+        """Test that raw image bytes can be used as edit cache parameters."""
+        mock_cache_settings.enabled = True
+        cache_manager = CacheManager(mock_cache_settings)
+
+        await cache_manager.set_image_edit(
+            {"image_id": "edited"}, image_data=b"\x89PNG", prompt="add a hat"
+        )
+
+        cached = await cache_manager.get_image_edit(
+            image_data=b"\x89PNG", prompt="add a hat"
+        )
+        assert cached == {"image_id": "edited"}
+        assert (
+            await cache_manager.get_image_edit(image_data=b"GIF8", prompt="add a hat")
+            is None
+        )
+
+    def test_cache_manager_key_ignores_parameter_order(self, mock_cache_settings):
+        """Test that cache keys are stable across keyword order."""
+        mock_cache_settings.enabled = True
+        cache_manager = CacheManager(mock_cache_settings)
+
+        key1 = cache_manager._make_key("image_gen", prompt="sunset", quality="high")
+        key2 = cache_manager._make_key("image_gen", quality="high", prompt="sunset")
+
+        assert key1 == key2
+        assert len(key1) == 32
+        assert key1 != cache_manager._make_key(
+            "image_edit", prompt="sunset", quality="high"
+        )
+
 
 class TestOpenAIClientManager:
     """Test OpenAI client manager functionality."""
@@ -630,6 +805,44 @@ class TestOpenAIClientManager:
             timeout=300.0,
         )
 
+    @patch("openai.DefaultAioHttpClient", create=True)
+    @patch("image_gen_mcp.utils.openai_client.AsyncOpenAI")
+    def test_openai_client_aiohttp_transport(
+        self, mock_openai_class, mock_aiohttp_client_class, mock_openai_settings
+    ):
+        """Test that the aiohttp transport is passed to AsyncOpenAI when selected."""
+        mock_openai_settings.http_transport = "aiohttp"
+
+        manager = OpenAIClientManager(mock_openai_settings)
+        manager.client
+
+        mock_aiohttp_client_class.assert_called_once_with(
+            timeout=mock_openai_settings.timeout
+        )
+        _, kwargs = mock_openai_class.call_args
+        assert kwargs["http_client"] is mock_aiohttp_client_class.return_value
+
+    @pytest.mark.asyncio
+    @patch("image_gen_mcp.utils.openai_client.httpx.AsyncClient")
+    async def test_download_image_reuses_http_client(
+        self, mock_client_class, mock_openai_settings
+    ):
+        """Test that downloads share one pooled HTTP client until close."""
+        mock_http_client = MagicMock()
+        mock_http_client.get = AsyncMock(return_value=MagicMock(content=b"image"))
+        mock_http_client.aclose = AsyncMock()
+        mock_client_class.return_value = mock_http_client
+
+        manager = OpenAIClientManager(mock_openai_settings)
+        assert await manager.download_image("https://example.com/a.png") == b"image"
+        assert await manager.download_image("https://example.com/b.png") == b"image"
+
+        assert mock_client_class.call_count == 1
+        assert mock_http_client.get.await_count == 2
+
+        await manager.close()
+        mock_http_client.aclose.assert_awaited_once()
+
 
 class TestImageFormatDetection:
     """Test image format detection using magic number signatures."""
@@ -698,3 +911,177 @@ class TestImageFormatDetection:
         # Non-WebP data
         png_data = PNG_SIGNATURE + b"fake_png_data"
         assert _is_webp_format(png_data) is False
+
+
+class TestImageDimensions:
+    """Test reading image dimensions from header bytes."""
+
+    @pytest.mark.parametrize(
+        ("file_format", "mode", "save_kwargs"),
+        [
+            ("PNG", "RGB", {}),
+            ("JPEG", "RGB", {"quality": 85}),
+            ("JPEG", "RGB", {"progressive": True}),
+            ("WEBP", "RGB", {"quality": 80}),
+            ("WEBP", "RGB", {"lossless": True}),
+            ("WEBP", "RGBA", {"quality": 80}),
+        ],
+    )
+    def test_matches_pillow(self, file_format, mode, save_kwargs):
+        """Test header parsing agrees with Pillow for each supported format."""
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.new(mode, (321, 123)).save(buffer, format=file_format, **save_kwargs)
+        assert read_image_dimensions(buffer.getvalue()) == (321, 123)
+
+    def test_unsupported_or_truncated_data(self):
+        """Test that unknown formats and truncated headers return None."""
+        assert read_image_dimensions(GIF_SIGNATURE + b"fake_gif_data") is None
+        assert read_image_dimensions(PNG_SIGNATURE + b"short") is None
+        assert read_image_dimensions(JPEG_SIGNATURE) is None
+
+
+class TestBase64Utils:
+    """Test base64 decoding helpers."""
+
+    def test_b64decode_round_trips(self):
+        """Test that bytes and text input decode to the original bytes."""
+        data = bytes(range(256)) * 4
+        encoded = base64.b64encode(data)
+        assert base64_utils.b64decode(encoded) == data
+        assert base64_utils.b64decode(encoded.decode()) == data
+
+    def test_b64decode_stdlib_fallback(self):
+        """Test that the stdlib fallback discards characters outside the alphabet."""
+        encoded = base64.b64encode(b"image bytes").decode()
+        with patch.object(base64_utils, "pybase64", None):
+            assert base64_utils.b64decode(encoded[:8] + "\n" + encoded[8:]) == (
+                b"image bytes"
+            )
+
+
+class TestJsonUtils:
+    """Test JSON serialization helpers."""
+
+    def test_dumps_pretty_round_trips(self):
+        """Test that output parses back to the original data."""
+        data = {"image_id": "abc", "size_bytes": 42, "metadata": {"tags": ["a"]}}
+        assert json.loads(json_utils.dumps_pretty(data)) == data
+
+    def test_dumps_pretty_stdlib_fallback(self):
+        """Test that the stdlib fallback matches json.dumps with indent=2."""
+        data = {"models": [{"model_id": "gpt-image-1"}], "total": 1}
+        with patch.object(json_utils, "orjson", None):
+            assert json_utils.dumps_pretty(data) == json.dumps(data, indent=2)
+
+    def test_dumps_pretty_bytes_stdlib_fallback(self):
+        """Test that the bytes fallback matches encoded json.dumps output."""
+        data = {"prompt": "a cat", "size": "1024x1024"}
+        with patch.object(json_utils, "orjson", None):
+            expected = json.dumps(data, indent=2).encode()
+            assert json_utils.dumps_pretty_bytes(data) == expected
+
+    def test_loads_accepts_bytes_and_text(self):
+        """Test that loads parses both bytes and str input."""
+        data = {"prompt": "caf\u00e9", "tags": [1, 2]}
+        encoded = json_utils.dumps_pretty_bytes(data)
+        assert json_utils.loads(encoded) == data
+        assert json_utils.loads(encoded.decode()) == data
+
+    def test_dumps_sorted_bytes_orders_keys(self):
+        """Test that key order does not change the output of either backend."""
+        first = {"quality": "high", "prompt": "a cat"}
+        second = {"prompt": "a cat", "quality": "high"}
+        encoded = json_utils.dumps_sorted_bytes(first)
+        assert encoded == json_utils.dumps_sorted_bytes(second)
+        with patch.object(json_utils, "orjson", None):
+            expected = b'{"prompt":"a cat","quality":"high"}'
+            assert json_utils.dumps_sorted_bytes(first) == expected
+
+
+class TestRequestLimiter:
+    """Test concurrency and rate limiting for upstream requests."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """Test that no more than max_concurrent requests run at once."""
+        limiter = RequestLimiter(max_concurrent=2, requests_per_minute=0)
+        active = 0
+        peak = 0
+
+        async def worker():
+            nonlocal active, peak
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_for_tokens(self):
+        """Test that requests beyond the bucket capacity are delayed."""
+        clock = MagicMock()
+        clock.monotonic.return_value = 0.0
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock.monotonic.return_value += delay
+
+        with (
+            patch("image_gen_mcp.utils.rate_limit.time", clock),
+            patch("image_gen_mcp.utils.rate_limit.asyncio.sleep", fake_sleep),
+        ):
+            limiter = RequestLimiter(max_concurrent=10, requests_per_minute=60)
+            limiter._tokens = 1.0
+
+            async with limiter:
+                pass
+            async with limiter:
+                pass
+
+        assert sleeps == [pytest.approx(1.0)]
+
+
+class TestInflightRequests:
+    """Test coalescing of concurrent identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_task(self):
+        """Test that concurrent callers with the same key run the work once."""
+        inflight = InflightRequests()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"image_id": "img_1"}
+
+        results = await asyncio.gather(*(inflight.run("key", work) for _ in range(3)))
+
+        assert calls == 1
+        assert all(result == {"image_id": "img_1"} for result in results)
+        assert len(inflight) == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_callers(self):
+        """Test that a failure is raised to every waiting caller."""
+        inflight = InflightRequests()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream failed")
+
+        results = await asyncio.gather(
+            inflight.run("key", work),
+            inflight.run("key", work),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(inflight) == 0